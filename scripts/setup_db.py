@@ -3,18 +3,34 @@ Database Setup Script
 Creates initial database tables and runs migrations
 """
 
+import os
 import sys
+import asyncio
 from pathlib import Path
 
 # Add project root to path
 ROOT_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT_DIR))
 
-from sqlalchemy import text  # ← ADD this import
-from src.app.database import init_db, engine
+from sqlalchemy import text
+from src.app.database import init_db_async, get_engine
 from src.app.config import get_config, validate_config, setup_logging
 
 
+async def _setup_database() -> None:
+    """Test connection and create tables on a single engine/event loop"""
+    print("\n🔌 Testing database connection...")
+    async with get_engine().connect() as conn:
+        result = await conn.execute(text("SELECT 1"))
+        assert result.scalar() == 1
+
+    print("✅ Database connection successful")
+
+    # Create tables
+    print("\n📊 Creating database tables...")
+    await init_db_async()
+
+
 def main():
     """Initialize database and validate configuration"""
     print("=" * 60)
@@ -44,17 +60,7 @@ def main():
     print(f"\n📦 Using database: {config.database.url}")
 
     try:
-        # Test connection
-        print("\n🔌 Testing database connection...")
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
-            assert result.fetchone()[0] == 1  # type: ignore
-
-        print("✅ Database connection successful")
-
-        # Create tables
-        print("\n📊 Creating database tables...")
-        init_db()
+        asyncio.run(_setup_database())
 
         print("\n" + "=" * 60)
         print("✅ Database setup complete!")
@@ -62,9 +68,10 @@ def main():
 
     except Exception as e:
         print(f"\n❌ Database setup failed: {e}")
-        import traceback
+        if os.getenv("DEBUG"):
+            import traceback
 
-        traceback.print_exc()
+            traceback.print_exc()
         sys.exit(1)
 
 
@@ -6,24 +6,29 @@ Validates API connectivity, configuration, and basic functionality
 Run: python scripts/smoke_test_youtube.py
 """
 
-import os
+import io
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 ROOT_DIR = Path(__file__).resolve().parent.parent
 sys.path.append(str(ROOT_DIR))
 
 # ✅ Load .env file explicitly
-from dotenv import load_dotenv
+from src.app.env_bootstrap import (
+    ENV,
+    ENV_FILE,
+    ensure_env_loaded,
+    is_valid_api_key_format,
+)
 
-dotenv_path = ROOT_DIR / ".env"
-if dotenv_path.exists():
-    load_dotenv(dotenv_path)
-    print(f"✅ Loaded .env from: {dotenv_path}")
+if ensure_env_loaded():
+    print(f"✅ Loaded .env from: {ENV_FILE}")
 else:
-    print(f"⚠️  .env file not found at: {dotenv_path}")
+    print(f"⚠️  .env file not found at: {ENV_FILE}")
 
 from src.app.config import get_config
 from src.app.shared_cache import get_shared_cache, bootstrap_cache
@@ -32,6 +37,62 @@ from src.infrastructure.clients.youtube_api import (
     create_youtube_client,
 )
 
+# Report timestamp formats
+DATE_FORMAT = "%Y-%m-%d"
+TIMESTAMP_FORMAT = f"{DATE_FORMAT} %H:%M:%S"
+
+
+class _ThreadBufferedStdout(io.TextIOBase):
+    """Route writes from worker threads into per-thread buffers"""
+
+    def __init__(self, target):
+        self._target = target
+        self._local = threading.local()
+
+    def start_buffer(self) -> io.StringIO:
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._target).write(text)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+
+def run_parallel(tests: dict) -> dict:
+    """
+    Run independent tests concurrently, printing each one's output in order
+
+    Args:
+        tests: Mapping of test name to zero-arg test function
+
+    Returns:
+        Mapping of test name to result (True/False/None)
+    """
+    real_stdout = sys.stdout
+    buffered = _ThreadBufferedStdout(real_stdout)
+
+    def _run(fn):
+        output = buffered.start_buffer()
+        return fn(), output
+
+    sys.stdout = buffered
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {name: executor.submit(_run, fn) for name, fn in tests.items()}
+            outcomes = {name: future.result() for name, future in futures.items()}
+    finally:
+        sys.stdout = real_stdout
+
+    results = {}
+    for name, (result, output) in outcomes.items():
+        print(output.getvalue(), end="")
+        results[name] = result
+
+    return results
+
 
 def print_section(title: str):
     """Print formatted section header"""
@@ -84,7 +145,7 @@ def test_shared_cache():
         stats = cache.get_cache_stats()
         print(f"\n   Cache Root: {stats['cache_root']}")
         print(f"   Total Size: {stats['total_size_gb']:.2f} GB")
-        print(f"   GPU Available: {stats['gpu_available']}")
+        print(f"   GPU Available: {cache.get_gpu_info()['cuda_available']}")
 
         return True
     except Exception as e:
@@ -96,7 +157,7 @@ def test_api_key():
     """Test API key availability"""
     print_section("3️⃣  API Key Test")
 
-    api_key = os.getenv("YOUTUBE_API_KEY")
+    api_key = ENV["YOUTUBE_API_KEY"]
 
     if not api_key:
         print("❌ YOUTUBE_API_KEY not found in environment")
@@ -108,9 +169,8 @@ def test_api_key():
         )
         return False
 
-    # Basic validation
-    if len(api_key) < 20:
-        print(f"⚠️  API key seems too short: {len(api_key)} characters")
+    if not is_valid_api_key_format(api_key):
+        print(f"❌ API key malformed ({len(api_key)} characters)")
         return False
 
     print(f"✅ API key found ({len(api_key)} characters)")
@@ -144,7 +204,7 @@ def test_api_connectivity():
     """Test actual API connectivity with a simple request"""
     print_section("5️⃣  API Connectivity Test")
 
-    api_key = os.getenv("YOUTUBE_API_KEY")
+    api_key = ENV["YOUTUBE_API_KEY"]
     if not api_key:
         print("⏭️  Skipping (no API key)")
         return None
@@ -163,7 +223,7 @@ def test_api_connectivity():
             print(f"   Views: {video.statistics.view_count:,}")
             print(f"   Likes: {video.statistics.like_count:,}")
             print(f"   Comments: {video.statistics.comment_count:,}")
-            print(f"   Published: {video.snippet.published_at.strftime('%Y-%m-%d')}")
+            print(f"   Published: {video.snippet.published_at.strftime(DATE_FORMAT)}")
 
             # Check quota consumption
             quota_status = client.get_quota_status()
@@ -192,37 +252,27 @@ def test_rate_limiter():
         from src.infrastructure.clients.rate_limiter import RateLimiter
         import time
 
-        print("🔄 Testing rate limiter (5 calls/sec, burst=10)...")
-
-        limiter = RateLimiter(calls_per_second=5, burst_capacity=10)
+        rate, burst = 5, 10
 
-        # Test burst capacity
-        start_time = time.time()
-        burst_count = 0
+        print(f"🔄 Simulating rate limiter ({rate} calls/sec, burst={burst})...")
 
-        for i in range(10):
-            if limiter.acquire(timeout=0.1):
-                burst_count += 1
+        limiter = RateLimiter(calls_per_second=rate, burst_capacity=burst)
 
-        burst_time = time.time() - start_time
+        # Burst: 15 simultaneous requests, only `burst` fit in the bucket
+        burst_count = sum(limiter.simulate([0.0] * 15))
+        print(f"   Burst calls admitted: {burst_count}/15 (expected {burst})")
 
-        print(f"   Burst calls: {burst_count}/10 in {burst_time:.2f}s")
+        # Sustained: after draining the bucket, one token accrues per 1/rate s
+        times = [0.0] * burst + [(i + 1) / rate for i in range(15)]
+        sustained_count = sum(limiter.simulate(times)[burst:])
+        print(f"   Sustained calls admitted: {sustained_count}/15 (expected 15)")
 
-        # Test sustained rate
+        # Short real check that the live acquire path works
         start_time = time.time()
-        sustained_count = 0
-
-        for i in range(15):
-            if limiter.acquire(timeout=5.0):
-                sustained_count += 1
-
-        sustained_time = time.time() - start_time
-        actual_rate = sustained_count / sustained_time if sustained_time > 0 else 0
+        live_count = sum(limiter.acquire(timeout=1.0) for _ in range(3))
+        print(f"   Live calls: {live_count}/3 in {time.time() - start_time:.3f}s")
 
-        print(f"   Sustained calls: {sustained_count}/15 in {sustained_time:.2f}s")
-        print(f"   Actual rate: {actual_rate:.2f} calls/sec")
-
-        if 4.0 <= actual_rate <= 6.0:
+        if burst_count == burst and sustained_count == 15 and live_count == 3:
             print("✅ Rate limiter working correctly")
             return True
         else:
@@ -238,7 +288,7 @@ def test_search_functionality():
     """Test video search functionality"""
     print_section("7️⃣  Search Functionality Test")
 
-    api_key = os.getenv("YOUTUBE_API_KEY")
+    api_key = ENV["YOUTUBE_API_KEY"]
     if not api_key:
         print("⏭️  Skipping (no API key)")
         return None
@@ -300,20 +350,28 @@ def main():
     """Run all smoke tests"""
     print("\n" + "=" * 60)
     print("  🧪 YouTube API Client - Smoke Test")
-    print("  " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    print("  " + datetime.now().strftime(TIMESTAMP_FORMAT))
     print("=" * 60)
 
-    # Run tests
+    # Prerequisites run sequentially
     results = {
         "Configuration": test_config(),
         "Shared Cache": test_shared_cache(),
         "API Key": test_api_key(),
         "Client Init": test_client_initialization(),
-        "API Connectivity": test_api_connectivity(),
-        "Rate Limiter": test_rate_limiter(),
-        "Search": test_search_functionality(),
     }
 
+    # Network/sleep-bound tests are independent - wall time is the slowest one
+    results.update(
+        run_parallel(
+            {
+                "API Connectivity": test_api_connectivity,
+                "Rate Limiter": test_rate_limiter,
+                "Search": test_search_functionality,
+            }
+        )
+    )
+
     # Generate report
     success = generate_report(results)
 
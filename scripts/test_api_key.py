@@ -12,22 +12,27 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).resolve().parent.parent
 sys.path.append(str(ROOT_DIR))
 
-from dotenv import load_dotenv
+from src.app.env_bootstrap import ENV, ensure_env_loaded, is_valid_api_key_format
 
-load_dotenv(ROOT_DIR / ".env")
+ensure_env_loaded()
 
 print("=" * 60)
 print("  🔑 YouTube API Key Direct Test")
 print("=" * 60)
 
 # Get API key
-api_key = os.getenv("YOUTUBE_API_KEY")
+api_key = ENV["YOUTUBE_API_KEY"]
 
 if not api_key:
     print("\n❌ YOUTUBE_API_KEY not found!")
     print("   Edit .env and add your API key")
     sys.exit(1)
 
+if not is_valid_api_key_format(api_key):
+    print(f"\n❌ API key malformed ({len(api_key)} characters)")
+    print("   Expected 35-45 characters of A-Z, a-z, 0-9, '_' or '-'")
+    sys.exit(1)
+
 print(f"\n✅ API Key Found")
 print(f"   Length: {len(api_key)} characters")
 print(f"   Preview: {api_key[:10]}...{api_key[-4:]}")
@@ -48,7 +53,9 @@ try:
     print(f"   URL: {url}")
     print(f"   Video ID: dQw4w9WgXcQ")
 
-    response = httpx.get(url, params=params, timeout=30.0)
+    # Single pooled client; connect timeout kept short so a bad network fails fast
+    with httpx.Client(timeout=httpx.Timeout(30.0, connect=5.0)) as client:
+        response = client.get(url, params=params)
 
     print(f"\n📊 Response:")
     print(f"   Status Code: {response.status_code}")
@@ -121,9 +128,10 @@ except ImportError:
 
 except Exception as e:
     print(f"\n❌ Error: {e}")
-    import traceback
+    if os.getenv("DEBUG"):
+        import traceback
 
-    traceback.print_exc()
+        traceback.print_exc()
     sys.exit(1)
 
 print("\n" + "=" * 60)
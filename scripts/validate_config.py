@@ -0,0 +1,32 @@
+"""
+Static Configuration Check
+Verifies settings class definitions without loading YAML or env values
+
+Run: python scripts/validate_config.py  (also wired into pre-commit)
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.config import validate_config_static
+
+
+def main():
+    """Run static config checks and exit non-zero on errors"""
+    errors = validate_config_static()
+
+    if errors:
+        print("❌ Configuration definition errors:")
+        for error in errors:
+            print(f"  - {error}")
+        sys.exit(1)
+
+    print("✅ Configuration definitions are valid")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,6 @@ from enum import Enum
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.config import get_config
@@ -106,15 +105,14 @@ async def check_database() -> ComponentHealth:
     """Check database connectivity"""
     start_time = time.time()
     try:
-        async with db_manager.session() as session:
-            await session.execute(text("SELECT 1"))
-            latency = (time.time() - start_time) * 1000
-            return ComponentHealth(
-                name="database",
-                status=HealthStatus.HEALTHY,
-                latency_ms=round(latency, 2),
-                message="Database connection successful"
-            )
+        await db_manager.ping()
+        latency = (time.time() - start_time) * 1000
+        return ComponentHealth(
+            name="database",
+            status=HealthStatus.HEALTHY,
+            latency_ms=round(latency, 2),
+            message="Database connection successful"
+        )
     except Exception as e:
         latency = (time.time() - start_time) * 1000
         logger.error(f"Database health check failed: {e}")
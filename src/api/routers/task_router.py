@@ -3,23 +3,28 @@ Task Management API Router
 REST endpoints for background task operations
 """
 
+import re
+import asyncio
 import logging
 from typing import List, Optional
 from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Query, Path, Body
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from src.infrastructure.tasks.celery_app import (
     celery_app,
     get_task_info,
     revoke_task,
-    get_active_tasks,
+    get_active_tasks_cached,
     get_worker_stats,
 )
+from src.app.dependencies import get_youtube_client
 from src.infrastructure.tasks.video_tasks import (
-    scrape_video_metadata,
+    InlineScrapeUnavailable,
     scrape_video_comments,
     scrape_videos_batch,
+    scrape_videos_inline,
     search_and_scrape_videos,
 )
 from src.infrastructure.tasks.channel_tasks import (
@@ -34,6 +39,7 @@ from src.infrastructure.tasks.workflow_tasks import (
 )
 from src.services.task_tracking_service import (
     get_task_status,
+    get_task_statuses_bulk,
     get_user_tasks,
     get_active_tasks as get_active_db_tasks,
     get_failed_tasks,
@@ -43,7 +49,22 @@ from src.services.task_tracking_service import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/tasks", tags=["Background Tasks"])
+router = APIRouter(
+    prefix="/api/v1/tasks",
+    tags=["Background Tasks"],
+    default_response_class=ORJSONResponse,
+)
+
+# YouTube ID formats (request models + precompiled batch validation)
+VIDEO_ID_PATTERN = r"^[A-Za-z0-9_-]{11}$"
+CHANNEL_ID_PATTERN = r"^UC[A-Za-z0-9_-]{22}$"
+_VIDEO_ID_RE = re.compile(VIDEO_ID_PATTERN)
+
+# Metadata-only requests up to this size run inline instead of via Celery
+INLINE_SCRAPE_MAX_VIDEOS = 5
+
+# Upper bound on IDs per batch request (body is parsed in memory)
+MAX_BATCH_VIDEO_IDS = 5000
 
 
 # ============================================================================
@@ -54,7 +75,9 @@ router = APIRouter(prefix="/api/v1/tasks", tags=["Background Tasks"])
 class VideoScrapeRequest(BaseModel):
     """Request to scrape video"""
 
-    video_id: str = Field(..., description="YouTube video ID")
+    video_id: str = Field(
+        ..., pattern=VIDEO_ID_PATTERN, description="YouTube video ID"
+    )
     fetch_comments: bool = Field(default=False, description="Include comment scraping")
     max_comments: int = Field(default=500, description="Max comments to fetch")
 
@@ -62,7 +85,9 @@ class VideoScrapeRequest(BaseModel):
 class ChannelScrapeRequest(BaseModel):
     """Request to scrape channel"""
 
-    channel_id: str = Field(..., description="YouTube channel ID")
+    channel_id: str = Field(
+        ..., pattern=CHANNEL_ID_PATTERN, description="YouTube channel ID"
+    )
     max_videos: int = Field(default=50, description="Max videos to fetch")
     include_analysis: bool = Field(default=False, description="Analyze videos")
 
@@ -102,6 +127,62 @@ class TaskStatusResponse(BaseModel):
 # ============================================================================
 
 
+def _dispatch_batch_scrape(
+    video_ids: List[str], user_id: Optional[str]
+) -> TaskResponse:
+    """Hand a metadata scrape to the Celery batch task (which retries)"""
+    task = scrape_videos_batch.apply_async(
+        kwargs={"video_ids": video_ids, "user_id": user_id}
+    )
+    return TaskResponse(
+        task_id=task.id,
+        status="pending",
+        message=f"Metadata scraping started for {len(video_ids)} video(s)",
+    )
+
+
+async def _scrape_metadata_inline(
+    video_ids: List[str], user_id: Optional[str]
+) -> TaskResponse:
+    """
+    Scrape a small metadata-only request in-process
+
+    Falls back to a Celery task if anything fails before the inline task
+    is recorded: building the client (e.g. no API key), the network after
+    the client's own retries, quota exhaustion or the rate limiter.
+
+    Returns:
+        TaskResponse for the recorded inline task or the Celery fallback
+    """
+    try:
+        client = get_youtube_client()
+    except Exception as e:
+        logger.warning(f"YouTube client unavailable ({e}), dispatching to Celery")
+        return _dispatch_batch_scrape(video_ids, user_id)
+
+    try:
+        scraped = await scrape_videos_inline(video_ids, client, user_id=user_id)
+    except InlineScrapeUnavailable as e:
+        logger.warning(f"Inline scrape failed ({e}), dispatching to Celery")
+        return _dispatch_batch_scrape(video_ids, user_id)
+
+    if scraped["status"] == "failed":
+        return TaskResponse(
+            task_id=scraped["task_id"],
+            status="failed",
+            message=f"No videos found for {len(video_ids)} requested ID(s)",
+        )
+
+    return TaskResponse(
+        task_id=scraped["task_id"],
+        status="completed",
+        message=(
+            f"Scraped metadata for "
+            f"{scraped['videos_scraped']}/{len(video_ids)} video(s)"
+        ),
+    )
+
+
 @router.post("/scrape/video", response_model=TaskResponse)
 async def scrape_video(request: VideoScrapeRequest, user_id: str = Query(None)):
     """
@@ -112,46 +193,64 @@ async def scrape_video(request: VideoScrapeRequest, user_id: str = Query(None)):
     - **max_comments**: Maximum comments to fetch
     """
     try:
-        if request.fetch_comments:
-            # Full analysis workflow
-            task = full_video_analysis.apply_async(
-                kwargs={
-                    "video_id": request.video_id,
-                    "include_comments": True,
-                    "max_comments": request.max_comments,
-                    "user_id": user_id,
-                }
-            )
-            message = f"Full analysis started for video {request.video_id}"
-        else:
-            # Just metadata
-            task = scrape_video_metadata.apply_async(args=(request.video_id, user_id))
-            message = f"Metadata scraping started for video {request.video_id}"
+        if not request.fetch_comments:
+            # Just metadata - a single API call, cheaper than a broker hop
+            return await _scrape_metadata_inline([request.video_id], user_id)
+
+        # Full analysis workflow
+        task = full_video_analysis.apply_async(
+            kwargs={
+                "video_id": request.video_id,
+                "include_comments": True,
+                "max_comments": request.max_comments,
+                "user_id": user_id,
+            }
+        )
 
         return TaskResponse(
             task_id=task.id,
             status="pending",
-            message=message,
+            message=f"Full analysis started for video {request.video_id}",
         )
 
     except Exception as e:
-        logger.error(f"Failed to start video scraping: {e}")
+        logger.exception("Failed to start video scraping")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/scrape/videos/batch", response_model=TaskResponse)
 async def scrape_videos_batch_endpoint(
-    video_ids: List[str] = Body(..., description="List of video IDs"),
+    video_ids: List[str] = Body(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_VIDEO_IDS,
+        description="List of video IDs",
+    ),
     include_comments: bool = Body(default=False),
     user_id: str = Query(None),
 ):
     """
     Batch scrape multiple videos
 
-    - **video_ids**: List of YouTube video IDs
+    - **video_ids**: List of YouTube video IDs (duplicates are dropped)
     - **include_comments**: Include comment scraping
     """
+    # Reject malformed IDs before anything is enqueued or tracked
+    invalid_ids = [vid for vid in video_ids if not _VIDEO_ID_RE.match(vid)]
+    if invalid_ids:
+        raise HTTPException(
+            status_code=422,
+            detail={"error": "Invalid video IDs", "video_ids": invalid_ids},
+        )
+
+    # Order-preserving dedupe - repeated IDs would cost quota twice
+    video_ids = list(dict.fromkeys(video_ids))
+
     try:
+        if len(video_ids) <= INLINE_SCRAPE_MAX_VIDEOS and not include_comments:
+            # Small metadata-only batch fits in one videos.list call
+            return await _scrape_metadata_inline(video_ids, user_id)
+
         task = bulk_video_scraping.apply_async(
             kwargs={
                 "video_ids": video_ids,
@@ -167,7 +266,7 @@ async def scrape_videos_batch_endpoint(
         )
 
     except Exception as e:
-        logger.error(f"Failed to start batch scraping: {e}")
+        logger.exception("Failed to start batch scraping")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -197,7 +296,7 @@ async def search_and_scrape(request: SearchScrapeRequest, user_id: str = Query(N
         )
 
     except Exception as e:
-        logger.error(f"Failed to start search scraping: {e}")
+        logger.exception("Failed to start search scraping")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -246,7 +345,7 @@ async def scrape_channel(request: ChannelScrapeRequest, user_id: str = Query(Non
         )
 
     except Exception as e:
-        logger.error(f"Failed to start channel scraping: {e}")
+        logger.exception("Failed to start channel scraping")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -279,10 +378,27 @@ async def get_task_status_endpoint(
         )
 
     except Exception as e:
-        logger.error(f"Failed to get task status: {e}")
+        logger.exception("Failed to get task status for %s", task_id)
         raise HTTPException(status_code=404, detail="Task not found")
 
 
+@router.post("/status/bulk")
+async def get_task_statuses_bulk_endpoint(
+    task_ids: List[str] = Body(..., description="Task IDs", max_length=1000),
+):
+    """
+    Get status of many tasks in one request
+
+    - **task_ids**: Task IDs to look up (single database query)
+    """
+    try:
+        return await get_task_statuses_bulk(task_ids)
+
+    except Exception as e:
+        logger.exception("Failed to get bulk task status")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.delete("/{task_id}")
 async def cancel_task(
     task_id: str = Path(..., description="Task ID"),
@@ -303,7 +419,7 @@ async def cancel_task(
             raise HTTPException(status_code=500, detail="Failed to cancel task")
 
     except Exception as e:
-        logger.error(f"Failed to cancel task: {e}")
+        logger.exception("Failed to cancel task %s", task_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -325,7 +441,7 @@ async def retry_task(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to retry task: {e}")
+        logger.exception("Failed to retry task %s", task_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -352,7 +468,7 @@ async def get_user_tasks_endpoint(
         return result
 
     except Exception as e:
-        logger.error(f"Failed to get user tasks: {e}")
+        logger.exception("Failed to get tasks for user %s", user_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -362,9 +478,12 @@ async def list_active_tasks():
     List all currently running tasks
     """
     try:
-        # Get from both Celery and database
-        celery_tasks = get_active_tasks()
-        db_tasks = await get_active_db_tasks()
+        # Celery inspect (shared, short-lived cache) and DB run concurrently;
+        # gather re-raises the first failure itself, not an ExceptionGroup
+        celery_tasks, db_tasks = await asyncio.gather(
+            asyncio.to_thread(get_active_tasks_cached),
+            get_active_db_tasks(),
+        )
 
         return {
             "celery_workers": celery_tasks,
@@ -372,7 +491,7 @@ async def list_active_tasks():
         }
 
     except Exception as e:
-        logger.error(f"Failed to list active tasks: {e}")
+        logger.exception("Failed to list active tasks")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -390,7 +509,7 @@ async def list_failed_tasks(
         return result
 
     except Exception as e:
-        logger.error(f"Failed to list failed tasks: {e}")
+        logger.exception("Failed to list failed tasks")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -409,7 +528,7 @@ async def get_statistics(
         return stats
 
     except Exception as e:
-        logger.error(f"Failed to get statistics: {e}")
+        logger.exception("Failed to get statistics")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -430,5 +549,5 @@ async def get_workers_status():
         }
 
     except Exception as e:
-        logger.error(f"Failed to get worker stats: {e}")
+        logger.exception("Failed to get worker stats")
         raise HTTPException(status_code=500, detail=str(e))
@@ -4,12 +4,12 @@ Standalone configuration system with environment variable overrides
 """
 
 import os
-import yaml
+import copy
+import json
 import logging
-import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, Literal, List
-from functools import lru_cache
+from typing import Dict, Any, Optional, Literal, List, Set
+from functools import cache, cached_property
 from pydantic import Field, BaseModel, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -26,40 +26,54 @@ logger = logging.getLogger(__name__)
 class APIConfig(BaseSettings):
     """API Server Configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="API_")
+    model_config = SettingsConfigDict(env_prefix="API_", frozen=True)
 
     host: str = Field(default="0.0.0.0", description="API host")
     port: int = Field(default=8000, description="API port")
     prefix: str = Field(default="/api/v1", description="API prefix")
     debug: bool = Field(default=False, description="Debug mode")
+    limit_concurrency: int = Field(
+        default=1000, description="Max concurrent connections before 503s"
+    )
     cors_origins: str = Field(
         default="http://localhost:3000,http://localhost:8000",
         description="CORS allowed origins (comma-separated)",
     )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins into list"""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+        """Parse CORS origins into list (once per settings instance)"""
+        return [
+            origin.strip() for origin in self.cors_origins.split(",") if origin.strip()
+        ]
 
 
 class DatabaseConfig(BaseSettings):
     """Database Configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="DB_")
+    model_config = SettingsConfigDict(env_prefix="DB_", frozen=True)
 
     url: str = Field(
         default="sqlite:///./youtube_automation.db", description="Database URL"
     )
     echo: bool = Field(default=False, description="Echo SQL queries")
-    pool_size: int = Field(default=5, description="Connection pool size")
-    max_overflow: int = Field(default=10, description="Max overflow connections")
+    pool_size: int = Field(default=20, description="Connection pool size")
+    max_overflow: int = Field(default=30, description="Max overflow connections")
+    pool_timeout: int = Field(
+        default=10, description="Seconds to wait for a pooled connection"
+    )
+    pool_recycle: int = Field(
+        default=1800, description="Recycle connections older than this (seconds)"
+    )
+    query_cache_size: int = Field(
+        default=1200, description="Compiled SQL statement cache size (per engine)"
+    )
 
 
 class CacheConfig(BaseSettings):
     """Cache Configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="CACHE_")
+    model_config = SettingsConfigDict(env_prefix="CACHE_", frozen=True)
 
     cache_root: str = Field(
         default="../AI_LLM_projects/ai_warehouse/cache",
@@ -76,7 +90,7 @@ class CacheConfig(BaseSettings):
 class LoggingConfig(BaseSettings):
     """Logging Configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="LOG_")
+    model_config = SettingsConfigDict(env_prefix="LOG_", frozen=True)
 
     level: str = Field(default="INFO", description="Log level")
     format: str = Field(
@@ -91,7 +105,7 @@ class LoggingConfig(BaseSettings):
 class FeaturesConfig(BaseSettings):
     """Feature Flags Configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="FEATURE_")
+    model_config = SettingsConfigDict(env_prefix="FEATURE_", frozen=True)
 
     enable_caption: bool = Field(default=True, description="Enable caption feature")
     enable_vqa: bool = Field(default=True, description="Enable VQA feature")
@@ -110,7 +124,7 @@ class FeaturesConfig(BaseSettings):
 class YouTubeAPISettings(BaseSettings):
     """YouTube API specific settings"""
 
-    model_config = SettingsConfigDict(env_prefix="YOUTUBE_")
+    model_config = SettingsConfigDict(env_prefix="YOUTUBE_", frozen=True)
 
     api_key: str = Field(default="", description="YouTube Data API v3 key")
     max_results_per_page: int = Field(
@@ -207,7 +221,7 @@ class YouTubeAPISettings(BaseSettings):
 class ScrapingSettings(BaseSettings):
     """Web scraping configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="SCRAPING_")
+    model_config = SettingsConfigDict(env_prefix="SCRAPING_", frozen=True)
 
     enabled: bool = Field(default=True, description="Enable web scraping fallback")
     use_selenium: bool = Field(
@@ -230,14 +244,7 @@ class ScrapingSettings(BaseSettings):
     request_delay_seconds: float = Field(
         default=2.0, description="Delay between requests"
     )
-    max_retries: int = Field(default=3, description="Max retry attempts")
     timeout_seconds: int = Field(default=30, description="Request timeout")
-    delay_min: float = Field(
-        default=2.0, description="Min delay between requests (seconds)"
-    )
-    delay_max: float = Field(
-        default=5.0, description="Max delay between requests (seconds)"
-    )
 
     # Performance
     max_concurrent_browsers: int = Field(
@@ -296,7 +303,7 @@ class ScrapingSettings(BaseSettings):
 class AnalysisSettings(BaseSettings):
     """Video analysis configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="ANALYSIS_")
+    model_config = SettingsConfigDict(env_prefix="ANALYSIS_", frozen=True)
 
     enable_sentiment: bool = Field(
         default=True, description="Enable sentiment analysis"
@@ -324,7 +331,7 @@ class AnalysisSettings(BaseSettings):
 class StorageSettings(BaseSettings):
     """Data storage configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="STORAGE_")
+    model_config = SettingsConfigDict(env_prefix="STORAGE_", frozen=True)
 
     output_format: str = Field(
         default="json", description="Default output format (json/csv/parquet)"
@@ -340,7 +347,7 @@ class StorageSettings(BaseSettings):
 class SecuritySettings(BaseSettings):
     """Security Configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="SECURITY_")
+    model_config = SettingsConfigDict(env_prefix="SECURITY_", frozen=True)
 
     rate_limit_per_minute: int = Field(default=60, description="Requests per minute")
     rate_limit_per_hour: int = Field(default=1000, description="Requests per hour")
@@ -350,7 +357,7 @@ class SecuritySettings(BaseSettings):
 class CeleryConfig(BaseSettings):
     """Celery Task Queue Configuration"""
 
-    model_config = SettingsConfigDict(env_prefix="CELERY_")
+    model_config = SettingsConfigDict(env_prefix="CELERY_", frozen=True)
 
     # Broker Settings
     broker_url: str = Field(
@@ -483,9 +490,6 @@ class CeleryConfig(BaseSettings):
     )
 
     # Performance Optimization
-    worker_prefetch_multiplier: int = Field(
-        default=4, description="How many messages to prefetch"
-    )
     task_compression: Literal["gzip", "bzip2", ""] = Field(
         default="", description="Task compression algorithm"
     )
@@ -504,6 +508,24 @@ class CeleryConfig(BaseSettings):
 # ============================================================================
 
 
+# Sentinel for keys absent from the YAML config (distinct from a None value)
+_MISSING = object()
+
+# Cache roots whose directory tree was verified in this process
+_initialized_cache_roots: Set[Path] = set()
+
+
+@cache
+def _load_settings(settings_cls: type) -> BaseSettings:
+    """
+    Build a settings section from the environment once per process
+
+    Sections are frozen, so every Config instance can share them;
+    reload_config(reload_env=True) / reset_config() clear this cache.
+    """
+    return settings_cls()
+
+
 class Config:
     """
     Main Application Configuration
@@ -520,93 +542,248 @@ class Config:
         self.config_path = config_path or "configs/app.yaml"
         self.yaml_config = self._load_yaml_config()
 
-        # Initialize component configs
-        self.api = APIConfig()
-        self.database = DatabaseConfig()
-        self.cache = CacheConfig()
-        self.logging = LoggingConfig()
-        self.security = SecuritySettings()
-        self.celery = CeleryConfig()
-
-        # YouTube-specific settings
-        self.features = FeaturesConfig()
-        self.youtube_api = YouTubeAPISettings()
-        self.scraping = ScrapingSettings()
-        self.analysis = AnalysisSettings()
-        self.storage = StorageSettings()
-
-        # Internal cache
+        # Component configs are cached properties, built on first access
+        # from process-wide settings (see _load_settings)
+
+        # Internal cache (dot-notation key -> resolved value, see get())
         self._yaml_cache: Dict[str, Any] = {}
+        self._ensured_dirs: Set[Path] = set()
+        self._validation_result: Optional[Dict[str, Any]] = None
 
-        # Ensure cache directories exist
+        # Ensure cache directories exist (materializes only `cache`)
         self._create_cache_directories()
 
+    def soft_reset(self) -> None:
+        """
+        Drop derived caches (lookups, summaries, validation) in place
+
+        The parsed YAML, settings sections and ensured directories are
+        kept, so the next access is cheap.
+        """
+        self._yaml_cache.clear()
+        self._validation_result = None
+        for name in ("_dict_cache", "_summary_cache"):
+            self.__dict__.pop(name, None)
+
+    # ------------------------------------------------------------------------
+    # Component configs (each reads the environment once, when first used)
+    # ------------------------------------------------------------------------
+
+    @cached_property
+    def api(self) -> APIConfig:
+        return _load_settings(APIConfig)
+
+    @cached_property
+    def database(self) -> DatabaseConfig:
+        return _load_settings(DatabaseConfig)
+
+    @cached_property
+    def cache(self) -> CacheConfig:
+        return _load_settings(CacheConfig)
+
+    @cached_property
+    def logging(self) -> LoggingConfig:
+        return _load_settings(LoggingConfig)
+
+    @cached_property
+    def security(self) -> SecuritySettings:
+        return _load_settings(SecuritySettings)
+
+    @cached_property
+    def celery(self) -> CeleryConfig:
+        return _load_settings(CeleryConfig)
+
+    # YouTube-specific settings
+
+    @cached_property
+    def features(self) -> FeaturesConfig:
+        return _load_settings(FeaturesConfig)
+
+    @cached_property
+    def youtube_api(self) -> YouTubeAPISettings:
+        return _load_settings(YouTubeAPISettings)
+
+    @cached_property
+    def scraping(self) -> ScrapingSettings:
+        return _load_settings(ScrapingSettings)
+
+    @cached_property
+    def analysis(self) -> AnalysisSettings:
+        return _load_settings(AnalysisSettings)
+
+    @cached_property
+    def storage(self) -> StorageSettings:
+        return _load_settings(StorageSettings)
+
+    # Resolved cache paths, built once instead of per accessor call
+
+    @cached_property
+    def cache_root_path(self) -> Path:
+        return Path(self.cache.cache_root)
+
+    @cached_property
+    def _outputs_root(self) -> Path:
+        return self.cache_root_path / "outputs"
+
     def _load_yaml_config(self) -> Dict[str, Any]:
-        """Load YAML configuration file"""
+        """
+        Load YAML configuration file
+
+        The parsed result is cached in a `<name>.yaml.json` sidecar and
+        reused while it is at least as new as the YAML file. Set
+        CONFIG_NO_CACHE=1 to always reparse the YAML.
+        """
         config_file = Path(self.config_path)
 
-        if not config_file.exists():
+        # One stat answers both "does it exist" and "is the sidecar fresh"
+        try:
+            config_mtime = config_file.stat().st_mtime
+        except FileNotFoundError:
             logger.warning(f"Config file not found: {config_file}, using defaults")
             return {}
 
+        use_cache = not os.getenv("CONFIG_NO_CACHE")
+        cache_file = config_file.with_suffix(config_file.suffix + ".json")
+
+        if use_cache:
+            try:
+                if cache_file.stat().st_mtime >= config_mtime:
+                    return json.loads(cache_file.read_bytes())
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+
+        # Deferred: entry points that never reach this don't pay for PyYAML
+        import yaml
+
+        try:
+            # libyaml-backed loader parses several times faster when available
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # pragma: no cover - PyYAML built without libyaml
+            from yaml import SafeLoader
+
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+            # Bytes go straight to the loader, which detects UTF-8/16 + BOM
+            data = yaml.load(config_file.read_bytes(), Loader=SafeLoader) or {}
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             return {}
 
-    def _create_cache_directories(self) -> None:
-        """Create necessary cache directories"""
-        cache_root = Path(self.cache.cache_root)
+        if use_cache:
+            self._write_yaml_cache(cache_file, data)
+
+        return data
+
+    @staticmethod
+    def _write_yaml_cache(cache_file: Path, data: Dict[str, Any]) -> None:
+        """Atomically write parsed YAML to its JSON sidecar (best effort)"""
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
 
+        try:
+            # Fails on YAML-only types (dates, sets) - those configs stay uncached
+            tmp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Config cache not written to {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def _create_cache_directories(self) -> None:
+        """
+        Create necessary cache directories
+
+        A `.initialized` marker in the cache root records a completed run,
+        so later starts cost one stat instead of a mkdir per directory.
+        Directories skipped this way are not assumed to exist, so the
+        output/cache getters still create one that was removed since.
+        Set CONFIG_SKIP_DIR_CREATION=1 where the layout is provisioned
+        externally (e.g. by an init container) to skip the check entirely.
+        """
+        cache_root = self.cache_root_path
         directories = [
-            cache_root,
-            cache_root / "videos",
-            cache_root / "channels",
-            cache_root / "analysis",
-            cache_root / "models",
-            cache_root / "datasets",
-            cache_root / "outputs",
-            cache_root / "temp",
+            cache_root / name
+            for name in (
+                "videos",
+                "channels",
+                "analysis",
+                "models",
+                "datasets",
+                "outputs",
+                "temp",
+            )
         ]
-
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        sentinel = cache_root / ".initialized"
+
+        if os.getenv("CONFIG_SKIP_DIR_CREATION") == "1":
+            # Provisioned elsewhere: nothing was checked, so nothing is
+            # recorded as ensured or initialized
+            return
+
+        # reload_config() rebuilds Config; the tree is only checked once
+        if cache_root not in _initialized_cache_roots and not sentinel.exists():
+            # Root once with parents; children then need a single mkdir each
+            os.makedirs(cache_root, exist_ok=True)
+            for directory in directories:
+                os.makedirs(directory, exist_ok=True)
+            sentinel.touch()
+            # Only what was just created is known to exist; a marker from
+            # an earlier run says nothing about directories removed since
+            self._ensured_dirs.update([cache_root, *directories])
+
+        _initialized_cache_roots.add(cache_root)
+
+    def _ensure_dir(self, path: Path) -> Path:
+        """Create directory once per Config instance (skips repeat mkdir)"""
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+        return path
 
     def get_output_dir(self, subdir: str = "") -> Path:
         """Get output directory for YouTube data"""
-        cache_root = Path(self.cache.cache_root)
-
         if subdir:
-            output_path = cache_root / "outputs" / subdir
-        else:
-            output_path = cache_root / "outputs"
+            return self._ensure_dir(self._outputs_root / subdir)
 
-        output_path.mkdir(parents=True, exist_ok=True)
-        return output_path
+        return self._ensure_dir(self._outputs_root)
 
     def get_cache_dir(self, cache_type: str = "videos") -> Path:
         """Get cache directory for YouTube data"""
-        cache_path = Path(self.cache.cache_root) / cache_type
-        cache_path.mkdir(parents=True, exist_ok=True)
-        return cache_path
+        return self._ensure_dir(self.cache_root_path / cache_type)
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by dot notation key"""
-        keys = key.split(".")
+        """Get configuration value by dot notation key (memoized per key)"""
+        try:
+            value = self._yaml_cache[key]
+        except KeyError:
+            value = self._yaml_cache[key] = self._resolve_key(key)
+
+        return default if value is _MISSING else value
+
+    def _resolve_key(self, key: str) -> Any:
+        """Walk yaml_config for a dot notation key (_MISSING if absent)"""
         value = self.yaml_config
 
-        for k in keys:
+        for k in key.split("."):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
 
         return value
 
     def to_dict(self) -> Dict[str, Any]:
-        """Export full configuration as dictionary"""
+        """Export full configuration as dictionary (copy, safe to mutate)"""
+        return copy.deepcopy(self._dict_cache)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get configuration summary (copy, safe to mutate)"""
+        return copy.deepcopy(self._summary_cache)
+
+    # Settings are fixed per instance (reload_config builds a new Config),
+    # so the serialized forms are built once
+
+    @cached_property
+    def _dict_cache(self) -> Dict[str, Any]:
         return {
             "api": self.api.model_dump(),
             "database": self.database.model_dump(),
@@ -619,8 +796,8 @@ class Config:
             "storage": self.storage.model_dump(),
         }
 
-    def get_summary(self) -> Dict[str, Any]:
-        """Get configuration summary"""
+    @cached_property
+    def _summary_cache(self) -> Dict[str, Any]:
         return {
             "app": self.yaml_config.get("app", {}),
             "features": {
@@ -670,14 +847,16 @@ class Config:
 # Global Configuration Instance (Singleton)
 # ============================================================================
 
-_config: Optional[Config] = None
-_config_lock = threading.Lock()
+# Path used when get_config() is called without one (set by reload_config)
+_default_config_path: Optional[str] = None
 
 
-@lru_cache()
+@cache
 def get_config(config_path: Optional[str] = None) -> Config:
     """
-    Get or create global configuration instance (Thread-safe singleton)
+    Get or create global configuration instance (cached singleton)
+
+    Cache hits are a plain dict lookup - no lock on the per-request path.
 
     Args:
         config_path: Optional path to config file
@@ -685,58 +864,115 @@ def get_config(config_path: Optional[str] = None) -> Config:
     Returns:
         Config instance
     """
-    global _config
-
-    if _config is None:
-        with _config_lock:
-            if _config is None:
-                _config = Config(config_path)
-                logger.info("✅ Configuration initialized")
+    config = Config(config_path or _default_config_path)
+    logger.info("✅ Configuration initialized")
+    return config
 
-    return _config
 
-
-def reload_config(config_path: Optional[str] = None) -> Config:
+def reload_config(
+    config_path: Optional[str] = None, reload_env: bool = False
+) -> Config:
     """
     Force reload configuration
 
+    By default only the YAML view and directories are rebuilt; the
+    environment-backed settings sections are reused.
+
     Args:
         config_path: Optional new config path
+        reload_env: Also re-read settings sections from the environment
 
     Returns:
         New Config instance
     """
-    global _config
+    global _default_config_path
 
-    with _config_lock:
-        get_config.cache_clear()  # Clear lru_cache
-        _config = Config(config_path)
-        logger.info("🔄 Configuration reloaded")
+    _default_config_path = config_path
+    if reload_env:
+        _load_settings.cache_clear()
+    get_config.cache_clear()
+    config = get_config()
+    logger.info("🔄 Configuration reloaded")
 
-    return _config
+    return config
 
 
-def reset_config() -> None:
-    """Reset global configuration (mainly for testing)"""
-    global _config
+def reset_config(hard: bool = True) -> None:
+    """
+    Reset global configuration (mainly for testing)
+
+    Args:
+        hard: Discard the Config and env-backed settings entirely. With
+            False, only derived caches on the current Config are dropped
+            (see Config.soft_reset) - much cheaper between test cases.
+    """
+    global _default_config_path
+
+    if not hard:
+        if get_config.cache_info().currsize:
+            get_config().soft_reset()
+        return
 
-    with _config_lock:
-        get_config.cache_clear()
-        _config = None
-        logger.info("🗑️ Configuration reset")
+    _default_config_path = None
+    _load_settings.cache_clear()
+    get_config.cache_clear()
+    logger.info("🗑️ Configuration reset")
 
 
 # ============================================================================
 # Configuration Validation
 # ============================================================================
 
+# Settings classes checked by validate_config_static()
+SETTINGS_CLASSES = (
+    APIConfig,
+    DatabaseConfig,
+    CacheConfig,
+    LoggingConfig,
+    FeaturesConfig,
+    YouTubeAPISettings,
+    ScrapingSettings,
+    AnalysisSettings,
+    StorageSettings,
+    SecuritySettings,
+    CeleryConfig,
+)
+
+
+def validate_config_static() -> List[str]:
+    """
+    Validate settings class definitions (no environment access)
+
+    Every field must have a default so Config() never fails on a missing
+    env var. Run from pre-commit via scripts/validate_config.py so this
+    check stays out of the runtime startup path.
 
-def validate_config(config: Optional[Config] = None) -> Dict[str, Any]:
+    Returns:
+        List of error messages (empty if valid)
     """
-    Validate configuration
+    errors = []
+
+    for settings_cls in SETTINGS_CLASSES:
+        for name, field in settings_cls.model_fields.items():
+            if field.is_required():
+                errors.append(f"{settings_cls.__name__}.{name} has no default")
+
+    return errors
+
+
+def validate_config(
+    config: Optional[Config] = None, refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Validate runtime configuration (paths, API keys, env-dependent values)
+
+    Static checks on the settings classes live in validate_config_static().
+    The result is cached on the Config instance (settings are frozen and
+    reload_config() builds a new one).
 
     Args:
         config: Config instance (uses global if None)
+        refresh: Re-run the checks instead of returning the cached result
 
     Returns:
         Validation result with errors and warnings
@@ -744,11 +980,19 @@ def validate_config(config: Optional[Config] = None) -> Dict[str, Any]:
     if config is None:
         config = get_config()
 
+    if config._validation_result is None or refresh:
+        config._validation_result = _run_validation(config)
+
+    return copy.deepcopy(config._validation_result)
+
+
+def _run_validation(config: Config) -> Dict[str, Any]:
+    """Run the runtime checks behind validate_config()"""
     errors = []
     warnings = []
 
     # Check cache root
-    cache_root = Path(config.cache.cache_root)
+    cache_root = config.cache_root_path
     if not cache_root.exists():
         try:
             cache_root.mkdir(parents=True, exist_ok=True)
@@ -759,11 +1003,10 @@ def validate_config(config: Optional[Config] = None) -> Dict[str, Any]:
     # Check log path
     if config.logging.file_path:
         log_path = Path(config.logging.file_path)
-        if not log_path.parent.exists():
-            try:
-                log_path.parent.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                errors.append(f"Cannot create log directory: {e}")
+        try:
+            config._ensure_dir(log_path.parent)
+        except Exception as e:
+            errors.append(f"Cannot create log directory: {e}")
 
     # Check YouTube API key
     if not config.youtube_api.api_key:
@@ -804,15 +1047,28 @@ def get_scraping_settings() -> ScrapingSettings:
     return get_config().scraping
 
 
+# Background thread draining queued records into the file handler, and the
+# root-logger handler feeding its queue (both replaced on re-setup)
+_log_listener = None
+_log_queue_handler = None
+
+
 def setup_logging(config: Optional[Config] = None) -> None:
     """
     Setup logging based on configuration
 
+    File output goes through a QueueHandler; a QueueListener thread does
+    the disk writes and rotation, so logging threads only enqueue.
+
     Args:
         config: Config instance (uses global if None)
     """
+    import atexit
+    import queue
     import logging.handlers
 
+    global _log_listener, _log_queue_handler
+
     if config is None:
         config = get_config()
 
@@ -832,7 +1088,7 @@ def setup_logging(config: Optional[Config] = None) -> None:
     # File handler (if specified)
     if config.logging.file_path:
         log_path = Path(config.logging.file_path)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        config._ensure_dir(log_path.parent)
 
         file_handler = logging.handlers.RotatingFileHandler(
             filename=log_path,
@@ -841,11 +1097,39 @@ def setup_logging(config: Optional[Config] = None) -> None:
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(logging.Formatter(config.logging.format))
-        root_logger.addHandler(file_handler)
+
+        shutdown_logging()  # Replace any listener from a previous setup
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        _log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        # Re-registering would queue one more exit call per setup
+        atexit.unregister(shutdown_logging)
+        atexit.register(shutdown_logging)
+
+        _log_queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger.addHandler(_log_queue_handler)
 
     logger.info(f"📝 Logging configured: level={config.logging.level}")
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the file-writer thread"""
+    global _log_listener, _log_queue_handler
+
+    # Detach first so no record lands on a queue nobody drains
+    if _log_queue_handler is not None:
+        logging.getLogger().removeHandler(_log_queue_handler)
+        _log_queue_handler = None
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
 # ============================================================================
 # Main Entry Point (Testing)
 # ============================================================================
@@ -11,7 +11,7 @@ import asyncio
 import logging
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 # Re-export all database components from infrastructure layer
 from src.infrastructure.database.connection import (
@@ -29,6 +29,7 @@ __all__ = [
     "DatabaseManager",
     "db_manager",
     "get_session",
+    "get_engine",
     "init_db",
     "init_db_async",
     "drop_all_tables",
@@ -36,6 +37,22 @@ __all__ = [
 ]
 
 
+def get_engine() -> AsyncEngine:
+    """
+    Get the process-wide async engine
+
+    Initializes the database manager from config on first use and reuses
+    the same engine (and its connection pool) on every later call.
+
+    Returns:
+        AsyncEngine instance
+    """
+    if not db_manager.is_initialized:
+        init_database_from_config()
+
+    return db_manager.engine
+
+
 def init_db() -> None:
     """
     Initialize database (synchronous wrapper)
@@ -3,13 +3,12 @@ Service Dependency Injection
 FastAPI dependency providers for services
 """
 
-from typing import AsyncGenerator
-from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncGenerator
+from functools import cache
 
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.services import VideoService, CaptionService
-from src.infrastructure.clients.youtube_api import create_youtube_client
 from src.infrastructure.repositories import (
     VideoRepository,
     ChannelRepository,
@@ -20,6 +19,11 @@ from src.app.shared_cache import get_shared_cache
 from src.app.config import get_config
 from src.infrastructure.database import get_session
 
+# Services and the API client are imported on first use so that modules
+# needing only get_db don't load the whole service layer
+if TYPE_CHECKING:
+    from src.services import CaptionService, VideoService
+
 
 # ============================================================================
 # Database Dependency
@@ -44,20 +48,36 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 # ============================================================================
 
 
-@lru_cache()
+@cache
 def get_youtube_client():
     """
-    Get or create YouTube API client (Singleton)
+    Get or create YouTube API client (process-wide singleton)
+
+    Built on first use rather than at import, so importing this module
+    does not require an API key.
 
     Returns:
         YouTubeAPIClient instance
     """
+    from src.infrastructure.clients.youtube_api import create_youtube_client
+
     return create_youtube_client()
 
 
+@cache
+def _shared_service_deps():
+    """
+    Process-wide collaborators shared by every service instance
+
+    Returns:
+        (youtube_client, cache, config) tuple, built on first use
+    """
+    return get_youtube_client(), get_shared_cache(), get_config()
+
+
 async def get_video_service(
     session: AsyncSession,
-) -> VideoService:
+) -> "VideoService":
     """
     Create VideoService with all dependencies
 
@@ -70,9 +90,9 @@ async def get_video_service(
     Returns:
         VideoService instance
     """
-    youtube_client = get_youtube_client()
-    cache = get_shared_cache()
-    config = get_config()
+    from src.services import VideoService
+
+    youtube_client, cache, config = _shared_service_deps()
 
     # Create repositories with session
     video_repo = VideoRepository(session)
@@ -89,16 +109,19 @@ async def get_video_service(
 
 
 async def get_video_service_dep(
-    session: AsyncSession = None,  # Will be injected via get_session
-) -> AsyncGenerator[VideoService, None]:
+    session: AsyncSession = Depends(get_db),
+) -> AsyncGenerator["VideoService", None]:
     """
     FastAPI Dependency provider for VideoService
 
+    The session comes from get_db, which FastAPI resolves once per
+    request, so a route that also depends on get_db shares one session.
+
     Usage in FastAPI:
         @router.get("/videos/{video_id}")
         async def get_video(
             video_id: str,
-            session: AsyncSession = Depends(get_session),
+            session: AsyncSession = Depends(get_db),
             service: VideoService = Depends(get_video_service_dep)
         ):
             # Note: session must be passed to service methods
@@ -107,15 +130,7 @@ async def get_video_service_dep(
     Yields:
         VideoService instance with injected session
     """
-    # Use get_session to obtain a proper session if not provided
-    if session is None:
-        async for db_session in get_session():
-            service = await get_video_service(db_session)
-            yield service
-            return
-
-    service = await get_video_service(session)
-    yield service
+    yield await get_video_service(session)
 
 
 # ============================================================================
@@ -124,30 +139,26 @@ async def get_video_service_dep(
 
 
 async def get_caption_service(
-    session: AsyncSession = None,
-) -> CaptionService:
+    session: AsyncSession = Depends(get_db),
+) -> "CaptionService":
     """
     Create CaptionService with all dependencies
 
     Args:
-        session: AsyncSession for database operations
+        session: AsyncSession for database operations (the request's
+            get_db session when used as a FastAPI dependency)
 
     Returns:
         CaptionService instance
     """
-    # Use get_session to obtain a proper session if not provided
-    if session is None:
-        async for db_session in get_session():
-            return await _create_caption_service(db_session)
-
     return await _create_caption_service(session)
 
 
-async def _create_caption_service(session: AsyncSession) -> CaptionService:
+async def _create_caption_service(session: AsyncSession) -> "CaptionService":
     """Helper to create CaptionService with session"""
-    youtube_client = get_youtube_client()
-    cache = get_shared_cache()
-    config = get_config()
+    from src.services import CaptionService
+
+    youtube_client, cache, config = _shared_service_deps()
 
     # Create repositories with session
     caption_repo = CaptionRepository(session)
@@ -0,0 +1,66 @@
+"""
+Environment Bootstrap
+Loads the project .env file once per process and snapshots hot keys
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+ENV_FILE = ROOT_DIR / ".env"
+
+# Keys read repeatedly by scripts/workers, frozen after bootstrap
+SNAPSHOT_KEYS = ("YOUTUBE_API_KEY",)
+
+ENV: Dict[str, Optional[str]] = {}
+
+# Google API keys are ~39 URL-safe characters; catches placeholders/typos
+_API_KEY_RE = re.compile(r"^[A-Za-z0-9_-]{35,45}$")
+
+_loaded = False
+_env_file_found = False
+
+
+def ensure_env_loaded() -> bool:
+    """
+    Load .env into os.environ (idempotent)
+
+    Existing environment variables are never overridden. Subsequent calls
+    are no-ops, so every entry point can call this unconditionally.
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    global _loaded, _env_file_found
+
+    if _loaded:
+        return _env_file_found
+
+    _env_file_found = ENV_FILE.exists()
+    if _env_file_found:
+        load_dotenv(ENV_FILE, override=False)
+
+    ENV.update({key: os.environ.get(key) for key in SNAPSHOT_KEYS})
+    _loaded = True
+
+    return _env_file_found
+
+
+def is_valid_api_key_format(api_key: Optional[str]) -> bool:
+    """
+    Check that an API key has the shape of a Google API key
+
+    Only the format is checked - a well-formed key can still be revoked
+    or restricted.
+
+    Args:
+        api_key: Key to check (None/empty is invalid)
+
+    Returns:
+        True if the key looks well-formed
+    """
+    return bool(api_key) and _API_KEY_RE.match(api_key) is not None
@@ -6,13 +6,14 @@ YouTube Web Automation Analysis Platform
 
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import sys
 from pathlib import Path
@@ -21,15 +22,24 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(ROOT_DIR))
 # Import configuration and cache
-from src.app.config import get_config, validate_config, setup_logging
+from src.app.config import (
+    get_config,
+    validate_config,
+    setup_logging,
+    shutdown_logging,
+)
 from src.app.shared_cache import get_shared_cache, bootstrap_cache
 
 # Import database manager
-from src.app.database import db_manager
+from src.app.database import db_manager, get_session
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Row totals on /system/database may lag inserts by up to this long
+DB_COUNTS_CACHE_KEY = "system.db_counts"
+DB_COUNTS_TTL_SECONDS = 30
+
 
 # ============================================================================
 # Application Lifecycle Management
@@ -73,6 +83,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     try:
         await db_manager.create_tables()
         logger.info("✅ Database initialized successfully")
+        warmed = await db_manager.warm_pool(config.database.pool_size)
+        logger.info(f"   Pool: {db_manager.engine.pool.status()} (warmed {warmed})")
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
         raise
@@ -113,10 +125,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     cache.clear_memory_cache()
 
     logger.info("✅ Application shutdown complete")
+    shutdown_logging()
 
 
 def _print_startup_summary(config, cache) -> None:
     """Print startup summary"""
+    api, features = config.api, config.features
+    host, port = api.host, api.port
+    gpu_info = cache.get_gpu_info()
+
     summary = f"""
 ╔══════════════════════════════════════════════════════════════════════╗
 ║          YouTube Web Automation Analysis Platform                    ║
@@ -127,24 +144,24 @@ def _print_startup_summary(config, cache) -> None:
    • Environment: {config.get('app.env', 'development')}
    • Database: {config.database.url.split('/')[-1]}
    • Cache Root: {cache.cache_root}
-   • API Host: {config.api.host}:{config.api.port}
-   • Debug Mode: {config.api.debug}
+   • API Host: {host}:{port}
+   • Debug Mode: {api.debug}
 
 🔌 Endpoints:
-   • API Docs: http://{config.api.host}:{config.api.port}/docs
-   • ReDoc: http://{config.api.host}:{config.api.port}/redoc
-   • OpenAPI: http://{config.api.host}:{config.api.port}/openapi.json
+   • API Docs: http://{host}:{port}/docs
+   • ReDoc: http://{host}:{port}/redoc
+   • OpenAPI: http://{host}:{port}/openapi.json
 
 🎯 Features Status:
-   • Caption: {'✅' if config.features.enable_caption else '❌'}
-   • VQA: {'✅' if config.features.enable_vqa else '❌'}
-   • Chat: {'✅' if config.features.enable_chat else '❌'}
-   • RAG: {'✅' if config.features.enable_rag else '❌'}
-   • T2I: {'✅' if config.features.enable_t2i else '❌'}
+   • Caption: {'✅' if features.enable_caption else '❌'}
+   • VQA: {'✅' if features.enable_vqa else '❌'}
+   • Chat: {'✅' if features.enable_chat else '❌'}
+   • RAG: {'✅' if features.enable_rag else '❌'}
+   • T2I: {'✅' if features.enable_t2i else '❌'}
 
 📊 GPU Info:
-   • Available: {cache.get_gpu_info()['cuda_available']}
-   • Device Count: {cache.get_gpu_info()['device_count']}
+   • Available: {gpu_info['cuda_available']}
+   • Device Count: {gpu_info['device_count']}
 
 ╔══════════════════════════════════════════════════════════════════════╗
 ║  Press Ctrl+C to stop the server                                     ║
@@ -174,6 +191,7 @@ def create_app() -> FastAPI:
         openapi_url="/openapi.json",
         lifespan=lifespan,
         debug=config.api.debug,
+        default_response_class=ORJSONResponse,
     )
 
     # Configure CORS
@@ -206,8 +224,8 @@ def _register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         """Handle HTTP exceptions"""
-        logger.error(f"HTTP error: {exc.status_code} - {exc.detail}")
-        return JSONResponse(
+        logger.error("HTTP error: %s - %s", exc.status_code, exc.detail)
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": exc.detail,
@@ -221,8 +239,8 @@ def _register_exception_handlers(app: FastAPI) -> None:
         request: Request, exc: RequestValidationError
     ):
         """Handle validation errors"""
-        logger.error(f"Validation error: {exc.errors()}")
-        return JSONResponse(
+        logger.error("Validation error: %s", exc.errors())
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": "Validation Error",
@@ -234,8 +252,8 @@ def _register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle all other exceptions"""
-        logger.exception(f"Unhandled exception: {exc}")
-        return JSONResponse(
+        logger.exception("Unhandled exception: %s", exc)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal Server Error",
@@ -248,30 +266,40 @@ def _register_exception_handlers(app: FastAPI) -> None:
 def _register_routers(app: FastAPI, config) -> None:
     """Register API routers"""
 
+    # Health body is constant per process; built on the first probe so
+    # importing the app doesn't touch the cache dirs or torch
+    health_body: Dict[str, Any] = {}
+
     # Health check endpoint
     @app.get("/health", tags=["System"])
     async def health_check():
         """Health check endpoint"""
-        cache = get_shared_cache()
-        return {
-            "status": "healthy",
-            "version": "0.1.0",
-            "database": "connected",
-            "cache_root": cache.cache_root,
-            "gpu_available": cache.get_gpu_info()["cuda_available"],
-        }
+        if not health_body:
+            cache = get_shared_cache()
+            health_body.update(
+                {
+                    "status": "healthy",
+                    "version": "0.1.0",
+                    "database": "connected",
+                    "cache_root": cache.cache_root,
+                    "gpu_available": cache.get_gpu_info()["cuda_available"],
+                }
+            )
+        return health_body
+
+    api_info = {
+        "message": "YouTube Web Automation Analysis API",
+        "version": "0.1.0",
+        "docs": "/docs",
+        "redoc": "/redoc",
+        "health": "/health",
+    }
 
     # API Root endpoint (JSON info)
     @app.get("/api", tags=["System"])
     async def api_root():
         """API root endpoint with API information"""
-        return {
-            "message": "YouTube Web Automation Analysis API",
-            "version": "0.1.0",
-            "docs": "/docs",
-            "redoc": "/redoc",
-            "health": "/health",
-        }
+        return api_info
 
     # System info endpoint
     @app.get("/system/info", tags=["System"])
@@ -288,28 +316,33 @@ def _register_routers(app: FastAPI, config) -> None:
 
     # Database info endpoint
     @app.get("/system/database", tags=["System"])
-    async def database_info():
+    async def database_info(session: AsyncSession = Depends(get_session)):
         """Get database information"""
-        from src.app.database import get_session
         from src.infrastructure.repositories import (
             ChannelRepository,
             VideoRepository,
             CommentRepository,
         )
 
-        async with db_manager.session() as session:
-            channel_repo = ChannelRepository(session)
-            video_repo = VideoRepository(session)
-            comment_repo = CommentRepository(session)
-
-            return {
-                "database_url": config.database.url.split("/")[-1],
-                "statistics": {
-                    "total_channels": await channel_repo.count(),
-                    "total_videos": await video_repo.count(),
-                    "total_comments": await comment_repo.count(),
-                },
+        # COUNT(*) scans whole tables; serve recent totals from memory.
+        # The session only checks out a connection on a cache miss.
+        cache = get_shared_cache()
+        statistics = cache.get_cache_item(DB_COUNTS_CACHE_KEY)
+
+        if statistics is None:
+            statistics = {
+                "total_channels": await ChannelRepository(session).count(),
+                "total_videos": await VideoRepository(session).count(),
+                "total_comments": await CommentRepository(session).count(),
             }
+            cache.set_cache_item(
+                DB_COUNTS_CACHE_KEY, statistics, ttl_seconds=DB_COUNTS_TTL_SECONDS
+            )
+
+        return {
+            "database_url": config.database.url.split("/")[-1],
+            "statistics": statistics,
+        }
 
     # Register pages router (HTML templates)
     from src.api.routers.pages_router import router as pages_router
@@ -386,10 +419,15 @@ if __name__ == "__main__":
 
     config = get_config()
 
+    # loop/http "auto" pick uvloop + httptools (uvicorn[standard]) where
+    # available and fall back to asyncio/h11 on platforms without them
     uvicorn.run(
         "src.app.main:app",
         host=config.api.host,
         port=config.api.port,
         reload=config.api.debug,
         log_level=config.logging.level.lower(),
+        loop="auto",
+        http="auto",
+        limit_concurrency=config.api.limit_concurrency,
     )
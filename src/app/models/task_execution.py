@@ -208,3 +208,11 @@ Index("idx_task_parent", TaskExecution.parent_task_id)
 
 # Index for time-based queries
 Index("idx_task_created", TaskExecution.created_at.desc())
+
+# Partial index for recent-failure listings (only failed rows are indexed)
+Index(
+    "idx_task_failed_recent",
+    TaskExecution.completed_at.desc(),
+    postgresql_where=TaskExecution.status == TaskStatus.FAILED,
+    sqlite_where=TaskExecution.status == TaskStatus.FAILED,
+)
@@ -147,20 +147,23 @@ class User(Base):
     )
 
     # Relationships
+    # Chat/VQA sessions store user_id as a free-form string with no foreign
+    # key, so these joins are explicit and read-only
     chat_sessions = relationship(
         "ChatSession",
-        back_populates="user",
-        foreign_keys="ChatSession.user_id",
+        primaryjoin="foreign(ChatSession.user_id) == cast(User.id, String)",
+        viewonly=True,
         lazy="dynamic",
     )
     vqa_sessions = relationship(
         "VQASession",
-        back_populates="user",
-        foreign_keys="VQASession.user_id",
+        primaryjoin="foreign(VQASession.user_id) == cast(User.id, String)",
+        viewonly=True,
         lazy="dynamic",
     )
     refresh_tokens = relationship(
         "RefreshToken",
+        primaryjoin="foreign(RefreshToken.user_id) == User.id",
         back_populates="user",
         cascade="all, delete-orphan",
         lazy="dynamic",
@@ -270,7 +273,12 @@ class RefreshToken(Base):
     )
 
     # Relationships
-    user = relationship("User", back_populates="refresh_tokens")
+    # user_id carries no database foreign key, so the join is explicit
+    user = relationship(
+        "User",
+        primaryjoin="foreign(RefreshToken.user_id) == User.id",
+        back_populates="refresh_tokens",
+    )
 
     def __repr__(self) -> str:
         return f"<RefreshToken(id={self.id}, user_id={self.user_id}, revoked={self.is_revoked})>"
@@ -15,6 +15,7 @@ from sqlalchemy import (
     Text,
     Boolean,
     ForeignKey,
+    Index,
     Enum as SQLEnum,
 )
 from sqlalchemy.orm import relationship
@@ -159,3 +160,7 @@ class Video(Base):
         if self.tags:
             return [tag.strip() for tag in self.tags.split(",")]
         return []
+
+
+# Trending: published_at range, view_count threshold/order from the index
+Index("idx_video_trending", Video.published_at, Video.view_count.desc())
@@ -4,21 +4,53 @@ Manages cache directories and provides unified access to cached data
 """
 
 import os
-import json
+import hashlib
+import mmap
+import time
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, Optional, Set, Tuple
+from datetime import datetime
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+def _scan_tree(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield every entry below root (depth-first, symlinks not followed)
+
+    os.scandir entries carry their type from the directory listing, so
+    no per-entry Path objects or extra stat calls are needed to recurse.
+    Unreadable directories are skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    yield entry
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory: {e}")
+
+
 class SharedCache:
     """
     Manages shared cache directories and cached data
     Provides unified interface for all caching operations
     """
 
+    # Seconds a get_cache_stats() walk is reused before re-scanning disk
+    STATS_TTL_SECONDS = 60.0
+
+    # Default memory cache capacity (override with CACHE_MEMORY_MAX_ITEMS)
+    MEMORY_MAX_ITEMS = 10000
+
     def __init__(self, cache_root: Optional[str] = None):
         """
         Initialize shared cache
@@ -32,8 +64,30 @@ class SharedCache:
             )
 
         self.cache_root = str(Path(cache_root).resolve())
-        self._memory_cache: Dict[str, Any] = {}
+        # LRU of key -> (value, expires_at); expires_at is time.monotonic()
+        # or None. Least recently used entries are evicted past the cap.
+        self._memory_cache: "OrderedDict[str, Tuple[Any, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._memory_max_items = int(
+            os.getenv("CACHE_MEMORY_MAX_ITEMS", self.MEMORY_MAX_ITEMS)
+        )
         self.app_dirs = {}
+        # Same entries as parsed Paths, built once for the path helpers
+        self._dir_paths: Dict[str, Path] = {}
+
+        # Directories already mkdir'ed by this instance (created on first use)
+        self._created_dirs: Set[Path] = set()
+
+        # Cached result of the (expensive) directory walk in get_cache_stats
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cached_at = 0.0
+
+        # GPU set is fixed for the life of the process; probed once
+        self._gpu_info: Optional[Dict[str, Any]] = None
+
+        # Digest of the registry bytes last written/read; unchanged saves skip
+        self._registry_digest: Optional[bytes] = None
 
         self._setup_environment()
         self._create_directories()
@@ -45,7 +99,13 @@ class SharedCache:
         logger.info(f"Cache root set to: {self.cache_root}")
 
     def _create_directories(self) -> None:
-        """Create application-specific cache directories"""
+        """
+        Register application-specific cache directories
+
+        Nothing is created here; each directory is made on first access
+        through get_path()/the get_*_path helpers, so a run only pays for
+        the directories it uses.
+        """
         self.app_dirs = {
             # Core directories
             "CACHE_ROOT": self.cache_root,
@@ -76,24 +136,26 @@ class SharedCache:
             "CONFIG_DIR": f"{self.cache_root}/config",
             "REGISTRY_FILE": f"{self.cache_root}/config/data_registry.json",
         }
+        self._dir_paths = {key: Path(path) for key, path in self.app_dirs.items()}
 
-        # Create all directories
-        for key, dir_path in self.app_dirs.items():
-            if dir_path.endswith(".json"):
-                # Create parent directory for files
-                Path(dir_path).parent.mkdir(parents=True, exist_ok=True)
-            else:
-                Path(dir_path).mkdir(parents=True, exist_ok=True)
+    def _ensure_dir(self, path: Path) -> Path:
+        """Create directory once per instance (skips repeat mkdir)"""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+        return path
 
     def _log_setup(self) -> None:
         """Log cache setup information"""
         logger.info(f"✅ SharedCache initialized: {self.cache_root}")
-        logger.info(f"📁 Created {len(self.app_dirs)} cache directories")
+        logger.info(f"📁 Registered {len(self.app_dirs)} cache directories")
 
     def get_path(self, key: str) -> str:
         """
         Get directory path by key
 
+        The directory (or a file entry's parent) is created on first use.
+
         Args:
             key: Directory key (e.g., 'VIDEOS', 'ANALYSIS')
 
@@ -105,31 +167,34 @@ class SharedCache:
         """
         if key not in self.app_dirs:
             raise KeyError(f"Unknown cache directory: {key}")
+
+        path = self._dir_paths[key]
+        self._ensure_dir(path.parent if path.suffix == ".json" else path)
         return self.app_dirs[key]
 
+    def _registry_path(self) -> Path:
+        """Registry file path (parent directory ensured)"""
+        path = self._dir_paths["REGISTRY_FILE"]
+        self._ensure_dir(path.parent)
+        return path
+
     def get_video_cache_path(self, video_id: str) -> Path:
         """Get cache path for video data"""
-        video_dir = Path(self.get_path("VIDEOS")) / video_id
-        video_dir.mkdir(parents=True, exist_ok=True)
-        return video_dir
+        return self._ensure_dir(self._dir_paths["VIDEOS"] / video_id)
 
     def get_channel_cache_path(self, channel_id: str) -> Path:
         """Get cache path for channel data"""
-        channel_dir = Path(self.get_path("CHANNELS")) / channel_id
-        channel_dir.mkdir(parents=True, exist_ok=True)
-        return channel_dir
+        return self._ensure_dir(self._dir_paths["CHANNELS"] / channel_id)
 
     def get_analysis_path(self, analysis_type: str, item_id: str) -> Path:
         """Get path for analysis results"""
-        analysis_dir = Path(self.get_path("ANALYSIS")) / analysis_type / item_id
-        analysis_dir.mkdir(parents=True, exist_ok=True)
-        return analysis_dir
+        return self._ensure_dir(
+            self._dir_paths["ANALYSIS"] / analysis_type / item_id
+        )
 
     def get_output_path(self, output_type: str = "reports") -> Path:
         """Get output directory path"""
-        output_dir = Path(self.get_path("OUTPUT_DIR")) / output_type
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return output_dir
+        return self._ensure_dir(self._dir_paths["OUTPUT_DIR"] / output_type)
 
     # ========================================================================
     # Memory Cache Operations
@@ -146,14 +211,12 @@ class SharedCache:
             value: Value to cache
             ttl_seconds: Time to live in seconds (None = no expiration)
         """
-        cache_item = {
-            "value": value,
-            "created_at": datetime.now(),
-            "expires_at": (
-                datetime.now() + timedelta(seconds=ttl_seconds) if ttl_seconds else None
-            ),
-        }
-        self._memory_cache[key] = cache_item
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._memory_cache[key] = (value, expires_at)
+        self._memory_cache.move_to_end(key)
+
+        if len(self._memory_cache) > self._memory_max_items:
+            self._memory_cache.popitem(last=False)
 
     def get_cache_item(self, key: str, default: Any = None) -> Any:
         """
@@ -166,17 +229,18 @@ class SharedCache:
         Returns:
             Cached value or default
         """
-        if key not in self._memory_cache:
+        try:
+            value, expires_at = self._memory_cache[key]
+        except KeyError:
             return default
 
-        cache_item = self._memory_cache[key]
-
         # Check if expired
-        if cache_item["expires_at"] and datetime.now() > cache_item["expires_at"]:
+        if expires_at is not None and time.monotonic() > expires_at:
             del self._memory_cache[key]
             return default
 
-        return cache_item["value"]
+        self._memory_cache.move_to_end(key)
+        return value
 
     def clear_expired_cache(self) -> int:
         """
@@ -185,12 +249,12 @@ class SharedCache:
         Returns:
             Number of items cleared
         """
-        now = datetime.now()
-        expired_keys = []
-
-        for key, cache_item in self._memory_cache.items():
-            if cache_item["expires_at"] and now > cache_item["expires_at"]:
-                expired_keys.append(key)
+        now = time.monotonic()
+        expired_keys = [
+            key
+            for key, (_, expires_at) in self._memory_cache.items()
+            if expires_at is not None and now > expires_at
+        ]
 
         for key in expired_keys:
             del self._memory_cache[key]
@@ -213,9 +277,25 @@ class SharedCache:
             registry_data: Registry data to save
         """
         try:
-            registry_path = Path(self.get_path("REGISTRY_FILE"))
-            with open(registry_path, "w", encoding="utf-8") as f:
-                json.dump(registry_data, f, indent=2, ensure_ascii=False)
+            registry_path = self._registry_path()
+
+            payload = orjson.dumps(
+                registry_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._registry_digest and registry_path.exists():
+                logger.debug("Registry unchanged, skipping write")
+                return
+
+            # Write a sibling temp file and swap it in, so a crash mid-write
+            # never leaves a truncated registry behind
+            tmp_path = registry_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, registry_path)
+            self._registry_digest = digest
+            self.invalidate_stats()
             logger.info(f"Saved registry to {registry_path}")
         except Exception as e:
             logger.error(f"Failed to save registry: {e}")
@@ -228,11 +308,25 @@ class SharedCache:
             Registry data or empty registry if not found
         """
         try:
-            registry_path = Path(self.get_path("REGISTRY_FILE"))
+            registry_path = self._registry_path()
 
             if registry_path.exists():
-                with open(registry_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                if registry_path.stat().st_size == 0:
+                    # mmap cannot map an empty file
+                    raw = registry_path.read_bytes()
+                    self._registry_digest = hashlib.blake2b(
+                        raw, digest_size=16
+                    ).digest()
+                    return orjson.loads(raw)
+
+                # Parse straight from the page cache, no intermediate bytes copy
+                with open(registry_path, "rb") as f, mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped, memoryview(mapped) as view:
+                    self._registry_digest = hashlib.blake2b(
+                        view, digest_size=16
+                    ).digest()
+                    return orjson.loads(view)
             else:
                 # Create empty registry
                 empty_registry = {
@@ -264,29 +358,23 @@ class SharedCache:
             Number of files cleaned
         """
         try:
-            temp_dirs = [
-                self.get_path("TEMP_DIR"),
-                self.get_path("TEMP_DOWNLOADS"),
-                self.get_path("TEMP_PROCESSING"),
-            ]
-
-            cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
+            # TEMP_DOWNLOADS/TEMP_PROCESSING live under TEMP_DIR, so one
+            # walk covers them; a temp dir never created yields nothing
+            cutoff_ts = time.time() - older_than_hours * 3600.0
             cleaned_count = 0
 
-            for temp_dir in temp_dirs:
-                temp_path = Path(temp_dir)
-                if temp_path.exists():
-                    for file_path in temp_path.rglob("*"):
-                        if file_path.is_file():
-                            file_mtime = datetime.fromtimestamp(
-                                file_path.stat().st_mtime
-                            )
-                            if file_mtime < cutoff_time:
-                                try:
-                                    file_path.unlink()
-                                    cleaned_count += 1
-                                except Exception as e:
-                                    logger.warning(f"Failed to delete {file_path}: {e}")
+            for entry in _scan_tree(self.app_dirs["TEMP_DIR"]):
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_ts:
+                        os.unlink(entry.path)
+                        cleaned_count += 1
+                except OSError as e:
+                    logger.warning(f"Failed to delete {entry.path}: {e}")
+
+            if cleaned_count:
+                self.invalidate_stats()
 
             logger.info(f"Cleaned up {cleaned_count} temporary files")
             return cleaned_count
@@ -295,25 +383,43 @@ class SharedCache:
             logger.error(f"Failed to cleanup temp files: {e}")
             return 0
 
-    def get_cache_stats(self) -> Dict[str, Any]:
+    def invalidate_stats(self) -> None:
+        """Drop cached disk statistics (call after writing/deleting files)"""
+        self._stats_cache = None
+
+    def get_cache_stats(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get cache statistics
 
+        The disk walk is cached for STATS_TTL_SECONDS; memory cache counts
+        are always current.
+
+        Args:
+            force_refresh: Re-scan disk even if a cached result is fresh
+
         Returns:
             Dictionary with cache statistics
         """
-        try:
-            cache_root_path = Path(self.cache_root)
+        if (
+            not force_refresh
+            and self._stats_cache is not None
+            and time.monotonic() - self._stats_cached_at < self.STATS_TTL_SECONDS
+        ):
+            return {
+                **self._stats_cache,
+                "memory_cache_items": len(self._memory_cache),
+            }
 
-            # Calculate total size
-            total_size = sum(
-                f.stat().st_size for f in cache_root_path.rglob("*") if f.is_file()
-            )
+        try:
+            # One walk for both totals (entry count includes directories)
+            total_size = 0
+            total_files = 0
+            for entry in _scan_tree(self.cache_root):
+                total_files += 1
+                if entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
             total_size_gb = total_size / (1024**3)
 
-            # Count files
-            total_files = len(list(cache_root_path.rglob("*")))
-
             stats = {
                 "cache_root": self.cache_root,
                 "total_size_gb": round(total_size_gb, 2),
@@ -323,6 +429,9 @@ class SharedCache:
                 "directories": list(self.app_dirs.keys()),
             }
 
+            self._stats_cache = stats
+            self._stats_cached_at = time.monotonic()
+
             return stats
 
         except Exception as e:
@@ -350,9 +459,19 @@ class SharedCache:
         """
         Get GPU information
 
+        CUDA is probed on the first call only; later calls return a copy
+        of the cached result.
+
         Returns:
             Dictionary with GPU information
         """
+        if self._gpu_info is None:
+            self._gpu_info = self._probe_gpu()
+
+        return {**self._gpu_info, "devices": list(self._gpu_info["devices"])}
+
+    def _probe_gpu(self) -> Dict[str, Any]:
+        """Query torch for CUDA devices (imports torch)"""
         try:
             import torch
 
@@ -397,6 +516,8 @@ class SharedCache:
 # ============================================================================
 
 _shared_cache: Optional[SharedCache] = None
+# Serializes first construction so concurrent callers share one instance
+_shared_cache_lock = threading.Lock()
 
 
 def get_shared_cache(cache_root: Optional[str] = None) -> SharedCache:
@@ -412,7 +533,9 @@ def get_shared_cache(cache_root: Optional[str] = None) -> SharedCache:
     global _shared_cache
 
     if _shared_cache is None:
-        _shared_cache = SharedCache(cache_root)
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = SharedCache(cache_root)
 
     return _shared_cache
 
@@ -420,7 +543,8 @@ def get_shared_cache(cache_root: Optional[str] = None) -> SharedCache:
 def reset_cache() -> None:
     """Reset global cache instance (useful for testing)"""
     global _shared_cache
-    _shared_cache = None
+    with _shared_cache_lock:
+        _shared_cache = None
 
 
 def bootstrap_cache(cache_root: Optional[str] = None) -> SharedCache:
@@ -13,7 +13,7 @@ Features:
 import time
 import logging
 import threading
-from typing import Callable, Optional, Any
+from typing import Callable, Optional, Any, List, Sequence
 from functools import wraps
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -58,24 +58,37 @@ class TokenBucket:
         self.tokens = min(self.capacity, self.tokens + new_tokens)
         self.last_refill = now
 
-    def consume(self, tokens: float = 1.0) -> bool:
+    def _try_consume(self, tokens: float) -> float:
         """
-        Try to consume tokens
+        Consume tokens if available, otherwise report the wait needed
 
         Args:
             tokens: Number of tokens to consume
 
         Returns:
-            True if tokens consumed, False if insufficient
+            0.0 if tokens consumed, else seconds until enough tokens accrue
         """
         with self.lock:
             self._refill()
 
-            if self.tokens >= tokens:
+            deficit = tokens - self.tokens
+            if deficit <= 0:
                 self.tokens -= tokens
-                return True
+                return 0.0
+
+            return deficit / self.refill_rate
+
+    def consume(self, tokens: float = 1.0) -> bool:
+        """
+        Try to consume tokens
 
-            return False
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            True if tokens consumed, False if insufficient
+        """
+        return self._try_consume(tokens) == 0.0
 
     def wait_for_tokens(
         self, tokens: float = 1.0, timeout: Optional[float] = None
@@ -83,6 +96,9 @@ class TokenBucket:
         """
         Wait until tokens become available
 
+        The lock is only held while refilling/consuming; the sleep happens
+        outside it so concurrent callers are not serialized behind a sleeper.
+
         Args:
             tokens: Number of tokens needed
             timeout: Maximum wait time in seconds (None = infinite)
@@ -90,25 +106,20 @@ class TokenBucket:
         Returns:
             True if tokens obtained, False if timeout
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout if timeout else None
 
         while True:
-            if self.consume(tokens):
+            wait_time = self._try_consume(tokens)
+            if wait_time == 0.0:
                 return True
 
-            # Check timeout
-            if timeout and (time.time() - start_time) >= timeout:
-                return False
-
-            # Calculate sleep time
-            with self.lock:
-                self._refill()
-                deficit = tokens - self.tokens
-                if deficit > 0:
-                    sleep_time = min(deficit / self.refill_rate, 1.0)
-                    time.sleep(sleep_time)
-                else:
-                    time.sleep(0.01)  # Small sleep to avoid busy-wait
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                # Tokens cannot accrue before the deadline - fail fast
+                if wait_time > remaining:
+                    return False
+
+            time.sleep(wait_time)
 
 
 # ============================================================================
@@ -174,6 +185,39 @@ class RateLimiter:
         else:
             return self.bucket.wait_for_tokens(1.0, timeout)
 
+    def simulate(self, request_times: Sequence[float]) -> List[bool]:
+        """
+        Replay request offsets through a fresh token bucket, without sleeping
+
+        Uses the same refill/consume arithmetic as the live bucket, starting
+        full, and leaves this limiter's state untouched. Requests that find
+        the bucket empty are rejected (not queued).
+
+        Args:
+            request_times: Non-decreasing request offsets in seconds
+
+        Returns:
+            Admission flag for each request
+        """
+        capacity = float(self.burst_capacity)
+        rate = self.calls_per_second
+        tokens = capacity
+        last = request_times[0] if request_times else 0.0
+
+        admitted = []
+        for t in request_times:
+            tokens = min(capacity, tokens + (t - last) * rate)
+            last = t
+
+            # Tolerate float drift so evenly spaced offsets refill whole tokens
+            if tokens >= 1.0 - 1e-9:
+                tokens = max(0.0, tokens - 1.0)
+                admitted.append(True)
+            else:
+                admitted.append(False)
+
+        return admitted
+
     def _acquire_redis(self, timeout: Optional[float] = None) -> bool:
         """Acquire permission using Redis (distributed limiting)"""
         # Redis-based rate limiting using INCR + EXPIRE
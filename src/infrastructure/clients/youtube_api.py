@@ -19,6 +19,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 import httpx
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 # Reuse existing config infrastructure
@@ -34,6 +35,9 @@ from src.infrastructure.clients.rate_limiter import AdaptiveRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# videos.list accepts at most 50 comma-separated IDs per request
+VIDEOS_BATCH_SIZE = 50
+
 
 # ============================================================================
 # Response Models (Type-Safe Data Containers)
@@ -165,6 +169,11 @@ class QuotaTracker:
     reset_time: datetime = field(
         default_factory=lambda: datetime.now() + timedelta(days=1)
     )
+    # Set once the low-quota warning has been logged for the current day
+    low_quota_warned: bool = field(default=False, init=False, repr=False)
+
+    # Remaining units below which a single warning is logged
+    LOW_QUOTA_THRESHOLD = 1000
 
     # Quota costs per operation (YouTube API v3 costs)
     COSTS = {
@@ -189,14 +198,17 @@ class QuotaTracker:
         self.used_quota += cost
 
         remaining = self.daily_limit - self.used_quota
-        if remaining < 1000:
-            logger.warning(f"⚠️ Low quota remaining: {remaining} units")
+        if remaining < self.LOW_QUOTA_THRESHOLD and not self.low_quota_warned:
+            # Warn once per day instead of on every call in bulk workloads
+            self.low_quota_warned = True
+            logger.warning("⚠️ Low quota remaining: %d units", remaining)
 
     def _reset_if_needed(self) -> None:
         """Reset quota counter if daily limit expired"""
         if datetime.now() >= self.reset_time:
             logger.info("🔄 Daily quota reset")
             self.used_quota = 0
+            self.low_quota_warned = False
             self.reset_time = datetime.now() + timedelta(days=1)
 
     def get_status(self) -> Dict[str, Any]:
@@ -261,9 +273,10 @@ class YouTubeAPIClient:
         self.max_retries = max_retries
         self.timeout = timeout
 
-        # HTTP client with connection pooling
+        # HTTP client with connection pooling (keep-alive reused across calls)
         self.client = httpx.Client(
-            timeout=timeout, limits=httpx.Limits(max_keepalive_connections=5)
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
         )
 
         # Quota tracking
@@ -330,7 +343,8 @@ class YouTubeAPIClient:
                 # Report success to adaptive rate limiter
                 self.rate_limiter.report_success()
 
-                return response.json()
+                # Decode raw bytes directly (skips httpx's text decode step)
+                return orjson.loads(response.content)
 
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
@@ -410,8 +424,10 @@ class YouTubeAPIClient:
         Returns:
             List of VideoResponse objects
         """
-        if len(video_ids) > 50:
-            raise ValueError("Maximum 50 video IDs per batch request")
+        if len(video_ids) > VIDEOS_BATCH_SIZE:
+            raise ValueError(
+                f"Maximum {VIDEOS_BATCH_SIZE} video IDs per batch request"
+            )
 
         params = {
             "part": "snippet,statistics,contentDetails",
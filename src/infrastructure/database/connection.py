@@ -6,22 +6,28 @@ Provides SQLAlchemy async engine and session management
 
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
+import asyncio
 import logging
 
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncSession,
     AsyncEngine,
     create_async_engine,
     async_sessionmaker,
 )
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import event
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
 
 logger = logging.getLogger(__name__)
 
 # Base class for all ORM models
 Base = declarative_base()
 
+# Liveness probe statement, built once and reused
+_PING_STMT = text("SELECT 1")
+
 
 class DatabaseManager:
     """
@@ -59,6 +65,9 @@ class DatabaseManager:
         echo: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        query_cache_size: int = 1200,
+        pool_timeout: int = 10,
+        pool_recycle: int = 1800,
     ) -> None:
         """
         Initialize the database connection
@@ -68,6 +77,11 @@ class DatabaseManager:
             echo: Echo SQL queries to log
             pool_size: Connection pool size
             max_overflow: Maximum overflow connections
+            query_cache_size: Compiled statement cache entries; repeated
+                queries skip SQL compilation (echo shows "[cached since ...]")
+            pool_timeout: Seconds to wait for a free connection before
+                failing (a burst errors fast instead of queueing forever)
+            pool_recycle: Replace connections older than this many seconds
         """
         if self._initialized:
             logger.warning("Database already initialized, skipping re-initialization")
@@ -76,21 +90,26 @@ class DatabaseManager:
         # Convert sync URL to async URL if needed
         async_url = self._convert_to_async_url(database_url)
 
-        # Create engine with appropriate settings
-        engine_kwargs = {
-            "echo": echo,
-        }
-
-        # SQLite-specific settings
-        if "sqlite" in async_url:
-            engine_kwargs["connect_args"] = {"check_same_thread": False}
+        # Dialect-specific settings, chosen once from the parsed URL
+        if make_url(async_url).get_backend_name() == "sqlite":
+            # Pool sizing does not apply to SQLite's default pools
+            backend_kwargs = {"connect_args": {"check_same_thread": False}}
         else:
             # PostgreSQL/MySQL settings
-            engine_kwargs["pool_size"] = pool_size
-            engine_kwargs["max_overflow"] = max_overflow
-            engine_kwargs["pool_pre_ping"] = True
-
-        self._engine = create_async_engine(async_url, **engine_kwargs)
+            backend_kwargs = {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_pre_ping": True,
+                "pool_timeout": pool_timeout,
+                "pool_recycle": pool_recycle,
+            }
+
+        self._engine = create_async_engine(
+            async_url,
+            echo=echo,
+            query_cache_size=query_cache_size,
+            **backend_kwargs,
+        )
 
         self._session_factory = async_sessionmaker(
             bind=self._engine,
@@ -152,6 +171,71 @@ class DatabaseManager:
             await conn.run_sync(Base.metadata.drop_all)
         logger.warning("All database tables dropped")
 
+    async def ping(self) -> None:
+        """
+        Round-trip a SELECT 1 on a pooled connection
+
+        Uses a bare connection (no session/transaction bookkeeping).
+        Raises if the database is unreachable.
+        """
+        async with self.engine.connect() as conn:
+            await conn.execute(_PING_STMT)
+
+    async def warm_pool(self, size: int) -> int:
+        """
+        Open pooled connections ahead of the first requests
+
+        Connections are opened concurrently, pinged and returned to the
+        pool, so early requests skip the connect/auth handshake.
+
+        Args:
+            size: Number of connections to open (capped at the pool size)
+
+        Returns:
+            Number of connections successfully opened (0 for pools that
+            do not keep connections, e.g. SQLite's NullPool)
+        """
+        pool_size = getattr(self.engine.pool, "size", None)
+        if not callable(pool_size):
+            return 0
+        size = min(size, pool_size())
+
+        results = await asyncio.gather(
+            *(self._open_pinged_connection() for _ in range(size)),
+            return_exceptions=True,
+        )
+
+        opened = 0
+        for result in results:
+            if isinstance(result, AsyncConnection):
+                await result.close()
+                opened += 1
+            else:
+                logger.warning(f"Pool warm-up connection failed: {result}")
+
+        return opened
+
+    async def _open_pinged_connection(self) -> AsyncConnection:
+        """Open a new connection and run the ping statement on it"""
+        conn = await self.engine.connect()
+        try:
+            await conn.execute(_PING_STMT)
+        except Exception:
+            await conn.close()
+            raise
+        return conn
+
+    def reset_after_fork(self) -> None:
+        """
+        Discard pooled connections inherited from a parent process
+
+        Call this in a freshly forked worker so it opens its own connections
+        instead of sharing the parent's sockets. The engine itself is kept,
+        so each process still builds its pool only once.
+        """
+        if self._engine is not None:
+            self._engine.sync_engine.dispose(close=False)
+
     async def close(self) -> None:
         """Close database connections"""
         if self._engine is not None:
@@ -195,4 +279,7 @@ def init_database_from_config() -> None:
         echo=config.database.echo,
         pool_size=config.database.pool_size,
         max_overflow=config.database.max_overflow,
+        query_cache_size=config.database.query_cache_size,
+        pool_timeout=config.database.pool_timeout,
+        pool_recycle=config.database.pool_recycle,
     )
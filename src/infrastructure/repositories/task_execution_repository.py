@@ -49,6 +49,28 @@ class TaskExecutionRepository(BaseRepository[TaskExecution]):
             logger.error(f"❌ Failed to get task by task_id: {e}")
             raise
 
+    async def get_by_task_ids(self, task_ids: List[str]) -> List[TaskExecution]:
+        """
+        Get multiple tasks by Celery task UUID in one query
+
+        Args:
+            task_ids: Celery task UUIDs
+
+        Returns:
+            List of matching task executions (missing IDs are omitted)
+        """
+        if not task_ids:
+            return []
+
+        try:
+            result = await self.session.execute(
+                select(TaskExecution).where(TaskExecution.task_id.in_(task_ids))
+            )
+            return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"❌ Failed to get tasks by task_ids: {e}")
+            raise
+
     async def get_by_user(
         self,
         user_id: str,
@@ -105,20 +127,26 @@ class TaskExecutionRepository(BaseRepository[TaskExecution]):
             raise
 
     async def get_failed_tasks(
-        self, hours: int = 24, limit: int = 100
+        self,
+        hours: int = 24,
+        limit: int = 100,
+        since: Optional[datetime] = None,
     ) -> List[TaskExecution]:
         """
         Get recently failed tasks
 
+        Served by the idx_task_failed_recent partial index.
+
         Args:
-            hours: Time window in hours
+            hours: Time window in hours (ignored if since is given)
             limit: Max results
+            since: Explicit cutoff time
 
         Returns:
             List of failed tasks
         """
         try:
-            cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+            cutoff_time = since or datetime.utcnow() - timedelta(hours=hours)
 
             result = await self.session.execute(
                 select(TaskExecution)
@@ -6,7 +6,7 @@ Handles all video-related database operations
 
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import select, func, and_, or_, desc, asc
+from sqlalchemy import select, insert, update, func, and_, or_, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 import logging
@@ -56,6 +56,39 @@ class VideoRepository(BaseRepository[Video]):
             logger.error(f"❌ Failed to get video with details: {e}")
             raise
 
+    async def list_with_relations(
+        self, video_ids: List[str], include_comments: bool = True
+    ) -> List[Video]:
+        """
+        Get several videos with relationships eagerly loaded
+
+        Each relationship is fetched with one IN-list query for the whole
+        batch, so serializing video.channel/comments/analytics does not
+        issue a query per row.
+
+        Args:
+            video_ids: YouTube video IDs
+            include_comments: Also load comments (can be large)
+
+        Returns:
+            List of videos with relationships loaded (order not guaranteed)
+        """
+        if not video_ids:
+            return []
+
+        options = [selectinload(Video.channel), selectinload(Video.analytics)]
+        if include_comments:
+            options.append(selectinload(Video.comments))
+
+        try:
+            result = await self.session.execute(
+                select(Video).where(Video.id.in_(video_ids)).options(*options)
+            )
+            return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"❌ Failed to get videos with relations: {e}")
+            raise
+
     async def get_by_channel(
         self,
         channel_id: str,
@@ -564,6 +597,10 @@ class VideoRepository(BaseRepository[Video]):
         """
         Bulk insert or update videos
 
+        Existing IDs are looked up with one query, new rows go through a
+        single Core executemany INSERT (no per-row ORM unit of work or
+        refresh) and everything is committed once.
+
         Args:
             videos_data: List of video attribute dictionaries
 
@@ -574,20 +611,52 @@ class VideoRepository(BaseRepository[Video]):
             created_count = 0
             updated_count = 0
 
+            ids = [video_data.get("id") for video_data in videos_data]
+            result = await self.session.execute(
+                select(Video.id).where(Video.id.in_(ids))
+            )
+            existing_ids = set(result.scalars().all())
+
+            # One timestamp for the whole batch
+            now = datetime.utcnow()
+            new_rows: Dict[str, Dict[str, Any]] = {}
+
             for video_data in videos_data:
                 video_id = video_data.get("id")
-                existing = await self.exists(video_id)
 
-                if existing:
-                    await self.update(video_id, **video_data)
+                if video_id in existing_ids:
+                    await self.session.execute(
+                        update(Video)
+                        .where(Video.id == video_id)
+                        .values(**video_data)
+                    )
+                    updated_count += 1
+                elif video_id in new_rows:
+                    # Repeated ID in the batch: later data wins
+                    new_rows[video_id].update(video_data)
                     updated_count += 1
                 else:
-                    video_data["first_scraped_at"] = datetime.utcnow()
-                    video_data["last_updated_at"] = datetime.utcnow()
-                    video_data["scrape_count"] = 1
-                    await self.create(**video_data)
+                    new_rows[video_id] = {
+                        **video_data,
+                        "first_scraped_at": now,
+                        "last_updated_at": now,
+                        "scrape_count": 1,
+                    }
                     created_count += 1
 
+            if new_rows:
+                # One executemany needs one key set: give every row the same
+                # columns, filling gaps with the column's scalar default
+                columns = set().union(*new_rows.values())
+                defaults = {key: self._insert_default(key) for key in columns}
+                rows = [
+                    {key: row.get(key, defaults[key]) for key in columns}
+                    for row in new_rows.values()
+                ]
+                # Table-level insert: the ORM bulk path would drop None
+                # values and split the batch into one INSERT per key set
+                await self.session.execute(insert(Video.__table__), rows)
+
             await self.session.commit()
             logger.info(
                 f"✅ Bulk upsert complete: {created_count} created, {updated_count} updated"
@@ -598,6 +667,15 @@ class VideoRepository(BaseRepository[Video]):
             logger.error(f"❌ Failed to bulk upsert videos: {e}")
             raise
 
+    @staticmethod
+    def _insert_default(key: str) -> Any:
+        """Scalar column default used to fill a key missing from a bulk row"""
+        column = Video.__table__.c.get(key)
+        default = column.default if column is not None else None
+        if default is not None and default.is_scalar:
+            return default.arg
+        return None
+
     # ========================================================================
     # Video Status Management
     # ========================================================================
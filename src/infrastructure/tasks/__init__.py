@@ -12,18 +12,29 @@ from src.infrastructure.tasks.celery_app import (
     get_worker_stats,
 )
 
-# Import all task modules to register them
-from src.infrastructure.tasks import (
-    video_tasks,
-    channel_tasks,
-    analysis_tasks,
-    workflow_tasks,
-    scheduled_tasks,
-    caption_tasks,
-    vqa_tasks,
-    chat_tasks,
-    rag_tasks,
-)
+# Task modules are loaded on first attribute access (and by the worker via
+# the app's include list); importing them here would re-enter celery_app
+# while it is still initializing
+_TASK_MODULES = {
+    "video_tasks",
+    "channel_tasks",
+    "analysis_tasks",
+    "workflow_tasks",
+    "scheduled_tasks",
+    "caption_tasks",
+    "vqa_tasks",
+    "chat_tasks",
+    "rag_tasks",
+}
+
+
+def __getattr__(name: str):
+    if name in _TASK_MODULES:
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "celery_app",
@@ -326,4 +326,33 @@ def extract_comment_keywords(
                             'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
                             'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which',
                             'who', 'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both',
-                            'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
\ No newline at end of file
+                            'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
+                            'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'also',
+                            'my', 'your', 'his', 'her', 'its', 'our', 'their', 'me', 'him', 'us',
+                            'them', 'if', 'then', 'there', 'here', 'about', 'up', 'out', 'into'}
+
+                keywords = Counter(
+                    word for word in words
+                    if len(word) > 2 and word not in stopwords and not word.isdigit()
+                )
+
+            result = {
+                "video_id": video_id,
+                "comments_processed": len(comments),
+                "keywords": [
+                    {"keyword": word, "count": count}
+                    for word, count in keywords.most_common(top_n)
+                ],
+                "extracted_at": datetime.utcnow().isoformat(),
+            }
+
+            update_task_status(self.request.id, "success", progress=100, result=result)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Keyword extraction failed for {video_id}: {e}")
+            update_task_status(self.request.id, "failed", error_message=str(e))
+            raise self.retry(exc=e)
+
+    return asyncio.run(_extract())
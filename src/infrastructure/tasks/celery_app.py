@@ -4,17 +4,42 @@ Celery Application Factory
 Creates and configures Celery app with project settings
 """
 
+import time
 import logging
+import threading
 from typing import Optional
 from celery import Celery, Task
-from celery.signals import task_prerun, task_postrun, task_failure, task_success
+from celery.signals import (
+    task_prerun,
+    task_postrun,
+    task_failure,
+    task_success,
+    worker_process_init,
+)
 from kombu import Queue, Exchange
 
+from src.app.env_bootstrap import ensure_env_loaded
 from src.app.config import get_config
 from src.app.shared_cache import get_shared_cache
 
+# Workers don't go through a script entry point - load .env once here
+ensure_env_loaded()
+
 logger = logging.getLogger(__name__)
 
+# Task modules registered with the app (loaded by the worker on startup)
+TASK_MODULES = [
+    "src.infrastructure.tasks.video_tasks",
+    "src.infrastructure.tasks.channel_tasks",
+    "src.infrastructure.tasks.analysis_tasks",
+    "src.infrastructure.tasks.workflow_tasks",
+    "src.infrastructure.tasks.scheduled_tasks",
+    "src.infrastructure.tasks.caption_tasks",
+    "src.infrastructure.tasks.vqa_tasks",
+    "src.infrastructure.tasks.chat_tasks",
+    "src.infrastructure.tasks.rag_tasks",
+]
+
 
 class DatabaseTask(Task):
     """
@@ -83,6 +108,9 @@ def create_celery_app(app_name: str = "youtube_automation") -> Celery:
         broker=celery_config.broker_url,
         backend=celery_config.result_backend,
         task_cls=DatabaseTask,  # Use custom base task class
+        # Imported by the worker at startup, not while this module loads:
+        # the task modules import celery_app from here
+        include=TASK_MODULES,
     )
 
     # Configure Celery
@@ -142,55 +170,6 @@ def create_celery_app(app_name: str = "youtube_automation") -> Celery:
         ),
     )
 
-    # Auto-discover tasks from all task modules
-    celery_app.autodiscover_tasks(
-        [
-            "src.infrastructure.tasks",
-        ],
-        related_name="video_tasks",
-        force=True,
-    )
-
-    celery_app.autodiscover_tasks(
-        [
-            "src.infrastructure.tasks",
-        ],
-        related_name="comment_tasks",
-        force=True,
-    )
-
-    celery_app.autodiscover_tasks(
-        [
-            "src.infrastructure.tasks",
-        ],
-        related_name="channel_tasks",
-        force=True,
-    )
-
-    celery_app.autodiscover_tasks(
-        [
-            "src.infrastructure.tasks",
-        ],
-        related_name="analysis_tasks",
-        force=True,
-    )
-
-    celery_app.autodiscover_tasks(
-        [
-            "src.infrastructure.tasks",
-        ],
-        related_name="scheduled_tasks",
-        force=True,
-    )
-
-    celery_app.autodiscover_tasks(
-        [
-            "src.infrastructure.tasks",
-        ],
-        related_name="workflow_tasks",
-        force=True,
-    )
-
     logger.info(f"✅ Celery app initialized: {app_name}")
     logger.info(f"📡 Broker: {celery_config.broker_url}")
     logger.info(f"📦 Result backend: {celery_config.result_backend}")
@@ -208,6 +187,16 @@ celery_app = create_celery_app()
 # ============================================================================
 
 
+@worker_process_init.connect
+def worker_process_init_handler(**kwargs):
+    """
+    Give each forked worker process its own database connection pool
+    """
+    from src.infrastructure.database import db_manager
+
+    db_manager.reset_after_fork()
+
+
 @task_prerun.connect
 def task_prerun_handler(
     sender=None, task_id=None, task=None, args=None, kwargs=None, **extra
@@ -353,6 +342,31 @@ def get_active_tasks() -> list:
     return all_tasks
 
 
+_active_tasks_cache = {"tasks": [], "fetched_at": float("-inf")}
+_active_tasks_lock = threading.Lock()
+
+
+def get_active_tasks_cached(max_age: float = 2.0) -> list:
+    """
+    Get currently executing tasks, reusing a recent inspect() result
+
+    inspect().active() broadcasts to every worker; concurrent pollers share
+    one broadcast per max_age window instead of each triggering their own.
+
+    Args:
+        max_age: Seconds a cached result stays valid
+
+    Returns:
+        List of active task dictionaries
+    """
+    with _active_tasks_lock:
+        if time.monotonic() - _active_tasks_cache["fetched_at"] >= max_age:
+            _active_tasks_cache["tasks"] = get_active_tasks()
+            _active_tasks_cache["fetched_at"] = time.monotonic()
+
+        return _active_tasks_cache["tasks"]
+
+
 def get_worker_stats() -> dict:
     """
     Get statistics about active workers
@@ -3,14 +3,20 @@ Video Scraping Background Tasks
 Celery tasks for YouTube video data collection
 """
 
+import re
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from src.infrastructure.tasks.celery_app import celery_app
-from src.infrastructure.clients.youtube_api import create_youtube_client
+from src.infrastructure.clients.youtube_api import (
+    VideoResponse,
+    YouTubeAPIClient,
+    create_youtube_client,
+)
 from src.app.database import db_manager
-from src.infrastructure.repositories import VideoRepository
+from src.app.models.video import VideoStatus
+from src.infrastructure.repositories import ChannelRepository, VideoRepository
 from src.services.task_tracking_service import create_task_record, update_task_status
 
 logger = logging.getLogger(__name__)
@@ -351,6 +357,151 @@ def scrape_video_comments(
     return asyncio.run(_scrape())
 
 
+class InlineScrapeUnavailable(Exception):
+    """The YouTube API could not be reached for an inline scrape"""
+
+
+_ISO_DURATION = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+
+def _duration_seconds(iso_duration: str) -> int:
+    """Parse an ISO 8601 duration (e.g. PT1H2M3S) to seconds"""
+    match = _ISO_DURATION.match(iso_duration or "")
+    if not match:
+        return 0
+
+    hours, minutes, seconds = (int(part or 0) for part in match.groups())
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _video_row(video: VideoResponse, now: datetime) -> Dict[str, Any]:
+    """Map a YouTube API video to Video column values"""
+    snippet = video.snippet
+    details = video.content_details
+    thumbnails = snippet.thumbnails
+
+    return {
+        "id": video.id,
+        "channel_id": snippet.channel_id,
+        "title": snippet.title,
+        "description": snippet.description,
+        "published_at": snippet.published_at,
+        "duration_seconds": _duration_seconds(details.duration),
+        "definition": details.definition,
+        "caption": details.caption == "true",
+        "licensed_content": details.licensed_content,
+        "view_count": video.statistics.view_count,
+        "like_count": video.statistics.like_count,
+        "comment_count": video.statistics.comment_count,
+        "category_id": snippet.category_id,
+        "tags": ",".join(snippet.tags) if snippet.tags else None,
+        "thumbnail_default": thumbnails.get("default", {}).get("url"),
+        "thumbnail_medium": thumbnails.get("medium", {}).get("url"),
+        "thumbnail_high": thumbnails.get("high", {}).get("url"),
+        "thumbnail_maxres": thumbnails.get("maxres", {}).get("url"),
+        "status": VideoStatus.COMPLETED,
+        "last_updated_at": now,
+    }
+
+
+async def scrape_videos_inline(
+    video_ids: List[str],
+    client: YouTubeAPIClient,
+    user_id: str = None,
+) -> Dict[str, Any]:
+    """
+    Scrape a handful of videos in-process, without a Celery round-trip
+
+    Used by the API for small metadata-only requests where broker and
+    worker dispatch latency would dominate a single batched API call.
+    The caller passes in its YouTube client so the connection pool and
+    quota tracker are shared across requests, and the work is recorded
+    as a TaskExecution under an ``inline-`` task ID so it can be polled
+    like any other task.
+
+    Args:
+        video_ids: List of video IDs (one videos.list request)
+        client: YouTube API client
+        user_id: User identifier
+
+    Returns:
+        Dictionary with task_id, status ("success" if any video was
+        found, else "failed") and the saved video summaries
+
+    Raises:
+        InlineScrapeUnavailable: If the YouTube API call fails for any
+            reason (network, quota, rate limit). Nothing is recorded, so
+            the caller can fall back to a Celery task with retries.
+    """
+    import asyncio
+    from uuid import uuid4
+
+    from src.infrastructure.repositories.task_execution_repository import (
+        TaskExecutionRepository,
+    )
+
+    # The client retries transient errors itself; a failure here is final
+    try:
+        videos = await asyncio.to_thread(client.get_videos_batch, video_ids)
+    except Exception as e:
+        raise InlineScrapeUnavailable(str(e)) from e
+
+    task_id = f"inline-{uuid4().hex}"
+    await create_task_record(
+        task_id=task_id,
+        task_name="scrape_videos_inline",
+        task_type="scraping",
+        args=(video_ids,),
+        user_id=user_id,
+    )
+
+    try:
+        now = datetime.utcnow()
+        rows = [_video_row(video, now) for video in videos]
+
+        async with db_manager.session() as session:
+            channel_repo = ChannelRepository(session)
+            channels = {video.snippet.channel_id: video.snippet for video in videos}
+
+            # Videos need their channel row; add a placeholder if it's new
+            for channel_id, snippet in channels.items():
+                if not await channel_repo.exists(channel_id):
+                    await channel_repo.create(
+                        id=channel_id,
+                        name=snippet.channel_title or "Unknown Channel",
+                        first_scraped_at=now,
+                        last_updated_at=now,
+                    )
+
+            if rows:
+                await VideoRepository(session).bulk_upsert_videos(rows)
+
+        results = [{"video_id": row["id"], "title": row["title"]} for row in rows]
+        result = {
+            "videos": results,
+            "videos_requested": len(video_ids),
+            "videos_scraped": len(results),
+            "scraped_at": now.isoformat(),
+        }
+
+        async with db_manager.session() as session:
+            task_repo = TaskExecutionRepository(session)
+            if results:
+                await task_repo.mark_success(task_id, result=result)
+                status = "success"
+            else:
+                await task_repo.mark_failed(task_id, "No videos found")
+                status = "failed"
+
+    except Exception as e:
+        async with db_manager.session() as session:
+            await TaskExecutionRepository(session).mark_failed(task_id, str(e))
+        raise
+
+    logger.info(f"⚡ Inline scraped {len(results)}/{len(video_ids)} videos")
+    return {"task_id": task_id, "status": status, **result}
+
+
 @celery_app.task(
     bind=True,
     name="tasks.scraping.scrape_videos_batch",
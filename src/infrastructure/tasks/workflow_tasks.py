@@ -12,6 +12,7 @@ from src.infrastructure.tasks.celery_app import celery_app
 from src.infrastructure.tasks.video_tasks import (
     scrape_video_metadata,
     scrape_video_comments,
+    scrape_videos_batch,
 )
 from src.infrastructure.tasks.channel_tasks import (
     scrape_channel_metadata,
@@ -21,6 +22,7 @@ from src.infrastructure.tasks.analysis_tasks import (
     analyze_video_sentiment,
     detect_comment_language,
 )
+from src.infrastructure.clients.youtube_api import VIDEOS_BATCH_SIZE
 from src.services.task_tracking_service import create_task_record, update_task_status
 
 logger = logging.getLogger(__name__)
@@ -308,20 +310,30 @@ def bulk_video_scraping(
                     ]
                 )
             else:
+                # Metadata only: one videos.list call per chunk of IDs
+                # instead of one task + API round trip per video
                 scrape_jobs = group(
                     [
-                        scrape_video_metadata.s(video_id=vid, user_id=user_id)
-                        for vid in video_ids
+                        scrape_videos_batch.s(
+                            video_ids=video_ids[i : i + VIDEOS_BATCH_SIZE],
+                            user_id=user_id,
+                        )
+                        for i in range(0, len(video_ids), VIDEOS_BATCH_SIZE)
                     ]
                 )
 
             # Execute in parallel
             scrape_results = scrape_jobs.apply_async().get(timeout=1800)
 
+            if include_comments:
+                successful = len([r for r in scrape_results if r])
+            else:
+                successful = sum(r.get("successful", 0) for r in scrape_results if r)
+
             result = {
                 "total_videos": len(video_ids),
-                "successful": len([r for r in scrape_results if r]),
-                "failed": len([r for r in scrape_results if not r]),
+                "successful": successful,
+                "failed": len(video_ids) - successful,
                 "results": scrape_results,
                 "completed_at": datetime.utcnow().isoformat(),
             }
@@ -41,6 +41,8 @@ from .exceptions import (
 
     # Permission Errors
     PermissionDeniedError,
+    AuthenticationError,
+    AuthorizationError,
 
     # Configuration Errors
     ConfigurationError,
@@ -98,6 +100,8 @@ __all__ = [
 
     # Permission Errors
     "PermissionDeniedError",
+    "AuthenticationError",
+    "AuthorizationError",
 
     # Configuration Errors
     "ConfigurationError",
@@ -312,6 +312,20 @@ class PermissionDeniedError(ServiceError):
         )
 
 
+class AuthenticationError(ServiceError):
+    """Credentials or token missing, invalid or expired"""
+
+    def __init__(self, message: str = "Authentication failed"):
+        super().__init__(message=message, code="AUTHENTICATION_FAILED")
+
+
+class AuthorizationError(ServiceError):
+    """Authenticated user lacks the required role"""
+
+    def __init__(self, message: str = "Not authorized"):
+        super().__init__(message=message, code="AUTHORIZATION_FAILED")
+
+
 # ============================================================================
 # Configuration Errors
 # ============================================================================
@@ -423,6 +437,8 @@ def error_to_http_status(error: ServiceError) -> int:
         "DATABASE_ERROR": 500,
         "TRANSACTION_ERROR": 500,
         "PERMISSION_DENIED": 403,
+        "AUTHENTICATION_FAILED": 401,
+        "AUTHORIZATION_FAILED": 403,
         "CONFIGURATION_ERROR": 500,
         "SERVICE_ERROR": 500,
     }
@@ -457,6 +473,8 @@ __all__ = [
     "TransactionError",
     # Permission Errors
     "PermissionDeniedError",
+    "AuthenticationError",
+    "AuthorizationError",
     # Configuration Errors
     "ConfigurationError",
     # Utility Functions
@@ -5,7 +5,7 @@ Business logic for task execution tracking
 """
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from src.app.models.task_execution import TaskStatus
@@ -147,6 +147,28 @@ async def get_task_status(task_id: str) -> Optional[Dict[str, Any]]:
         return task.to_dict()
 
 
+async def get_task_statuses_bulk(task_ids: List[str]) -> Dict[str, Any]:
+    """
+    Get status of many tasks with a single database query
+
+    Args:
+        task_ids: Task UUIDs
+
+    Returns:
+        Dictionary with found tasks keyed by ID and the IDs not found
+    """
+    async with db_manager.session() as session:
+        repo = TaskExecutionRepository(session)
+
+        tasks = await repo.get_by_task_ids(task_ids)
+        found = {task.task_id: task.to_dict() for task in tasks}
+
+        return {
+            "tasks": found,
+            "missing": [task_id for task_id in task_ids if task_id not in found],
+        }
+
+
 async def get_user_tasks(
     user_id: str,
     status: Optional[str] = None,
@@ -198,7 +220,7 @@ async def get_active_tasks() -> Dict[str, Any]:
     async with db_manager.session() as session:
         repo = TaskExecutionRepository(session)
 
-        tasks = await repo.list_active(limit=1000)
+        tasks = await repo.get_active_tasks(limit=1000)
 
         return {
             "tasks": [task.to_dict() for task in tasks],
@@ -219,7 +241,7 @@ async def get_failed_tasks(since: datetime = None) -> Dict[str, Any]:
     async with db_manager.session() as session:
         repo = TaskExecutionRepository(session)
 
-        tasks = await repo.list_failed(since=since, limit=1000)
+        tasks = await repo.get_failed_tasks(since=since, limit=1000)
 
         return {
             "tasks": [task.to_dict() for task in tasks],
@@ -4,9 +4,12 @@ Integration Tests for API Endpoints
 Tests FastAPI endpoint definitions and schemas
 """
 
+import importlib
+import httpx
 import pytest
 import pytest_asyncio
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -232,6 +235,221 @@ class TestRouterConfiguration:
         assert len(routes) > 0
 
 
+# ============================================================================
+# Inline Scrape Tests
+# ============================================================================
+
+
+class TestInlineScrape:
+    """Test the in-process path for small metadata-only scrapes"""
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    @pytest.mark.asyncio
+    async def test_inline_scrape_returns_recorded_task(self):
+        """Test inline scrape answers with the recorded inline task ID"""
+        task_router = importlib.import_module("src.api.routers.task_router")
+
+        scraped = {
+            "task_id": "inline-abc",
+            "status": "success",
+            "videos": [{"video_id": "dQw4w9WgXcQ", "title": "Test"}],
+            "videos_requested": 1,
+            "videos_scraped": 1,
+        }
+        client = MagicMock()
+        with patch.object(
+            task_router, "get_youtube_client", return_value=client
+        ), patch.object(
+            task_router, "scrape_videos_inline", AsyncMock(return_value=scraped)
+        ) as inline:
+            response = await task_router._scrape_metadata_inline(
+                ["dQw4w9WgXcQ"], "user-1"
+            )
+
+        inline.assert_awaited_once_with(["dQw4w9WgXcQ"], client, user_id="user-1")
+        assert response.task_id == "inline-abc"
+        assert response.status == "completed"
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    @pytest.mark.asyncio
+    async def test_inline_scrape_nothing_found_is_failed(self):
+        """Test an inline scrape that found no videos is not 'completed'"""
+        task_router = importlib.import_module("src.api.routers.task_router")
+
+        scraped = {
+            "task_id": "inline-abc",
+            "status": "failed",
+            "videos": [],
+            "videos_requested": 2,
+            "videos_scraped": 0,
+        }
+        with patch.object(
+            task_router, "get_youtube_client", return_value=MagicMock()
+        ), patch.object(
+            task_router, "scrape_videos_inline", AsyncMock(return_value=scraped)
+        ):
+            response = await task_router._scrape_metadata_inline(
+                ["dQw4w9WgXcQ", "9bZkp7q19f0"], None
+            )
+
+        assert response.status == "failed"
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            httpx.RequestError("Failed after 3 retries"),
+            ValueError("YouTube API quota exceeded"),
+            TimeoutError("Rate limited"),
+        ],
+    )
+    async def test_inline_scrape_falls_back_to_celery(self, error):
+        """Test an unusable API hands the work to a retrying Celery task"""
+        task_router = importlib.import_module("src.api.routers.task_router")
+        video_tasks = importlib.import_module("src.infrastructure.tasks.video_tasks")
+
+        client = MagicMock()
+        client.get_videos_batch.side_effect = error
+        batch_task = MagicMock()
+        batch_task.apply_async.return_value.id = "celery-123"
+
+        with patch.object(
+            task_router, "get_youtube_client", return_value=client
+        ), patch.object(
+            task_router, "scrape_videos_batch", batch_task
+        ), patch.object(
+            video_tasks, "create_task_record", AsyncMock()
+        ) as create_record:
+            response = await task_router._scrape_metadata_inline(
+                ["dQw4w9WgXcQ"], "user-1"
+            )
+
+        create_record.assert_not_awaited()
+        batch_task.apply_async.assert_called_once_with(
+            kwargs={"video_ids": ["dQw4w9WgXcQ"], "user_id": "user-1"}
+        )
+        assert response.task_id == "celery-123"
+        assert response.status == "pending"
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    @pytest.mark.asyncio
+    async def test_inline_scrape_without_client_falls_back_to_celery(self):
+        """Test a client that can't be built (no API key) uses Celery"""
+        task_router = importlib.import_module("src.api.routers.task_router")
+
+        batch_task = MagicMock()
+        batch_task.apply_async.return_value.id = "celery-123"
+
+        with patch.object(
+            task_router,
+            "get_youtube_client",
+            side_effect=ValueError("YouTube API key not found"),
+        ), patch.object(
+            task_router, "scrape_videos_batch", batch_task
+        ), patch.object(
+            task_router, "scrape_videos_inline"
+        ) as inline:
+            response = await task_router._scrape_metadata_inline(
+                ["dQw4w9WgXcQ"], None
+            )
+
+        inline.assert_not_called()
+        assert response.task_id == "celery-123"
+        assert response.status == "pending"
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    def test_batch_rejects_empty_video_ids(self):
+        """Test an empty batch is rejected before any scraping"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        task_router = importlib.import_module("src.api.routers.task_router")
+
+        app = FastAPI()
+        app.include_router(task_router.router)
+
+        with patch.object(task_router, "scrape_videos_inline") as inline:
+            response = TestClient(app).post(
+                "/api/v1/tasks/scrape/videos/batch", json={"video_ids": []}
+            )
+
+        assert response.status_code == 422
+        inline.assert_not_called()
+
+
+# ============================================================================
+# Active Task Listing Tests
+# ============================================================================
+
+
+class TestActiveTaskListing:
+    """Test /active/list combines Celery and database sources"""
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    @pytest.mark.asyncio
+    async def test_list_active_tasks_combines_sources(self):
+        """Test both sources are queried and returned together"""
+        task_router = importlib.import_module("src.api.routers.task_router")
+
+        with patch.object(
+            task_router, "get_active_tasks_cached", return_value={"worker@1": []}
+        ), patch.object(
+            task_router,
+            "get_active_db_tasks",
+            AsyncMock(return_value={"tasks": [], "total": 0}),
+        ):
+            result = await task_router.list_active_tasks()
+
+        assert result == {
+            "celery_workers": {"worker@1": []},
+            "database_tasks": {"tasks": [], "total": 0},
+        }
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    @pytest.mark.asyncio
+    async def test_list_active_tasks_reports_underlying_error(self):
+        """Test a failing source surfaces its own error message"""
+        from fastapi import HTTPException
+
+        task_router = importlib.import_module("src.api.routers.task_router")
+
+        with patch.object(
+            task_router, "get_active_tasks_cached", return_value={}
+        ), patch.object(
+            task_router,
+            "get_active_db_tasks",
+            AsyncMock(side_effect=RuntimeError("database is locked")),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await task_router.list_active_tasks()
+
+        assert exc_info.value.status_code == 500
+        assert exc_info.value.detail == "database is locked"
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    def test_active_list_route(self):
+        """Test the mounted /active/list route serves the combined listing"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        task_router = importlib.import_module("src.api.routers.task_router")
+
+        app = FastAPI()
+        app.include_router(task_router.router)
+
+        with patch.object(
+            task_router, "get_active_tasks_cached", return_value={}
+        ), patch.object(
+            task_router,
+            "get_active_db_tasks",
+            AsyncMock(return_value={"tasks": [], "total": 0}),
+        ):
+            response = TestClient(app).get("/api/v1/tasks/active/list")
+
+        assert response.status_code == 200
+        assert response.json()["database_tasks"] == {"tasks": [], "total": 0}
+
+
 # ============================================================================
 # Model Validation Tests
 # ============================================================================
@@ -377,6 +377,123 @@ class TestTaskFunctionsWithMock:
         assert channel_tasks is not None
 
 
+# ============================================================================
+# Inline Scrape Tests
+# ============================================================================
+
+
+class TestInlineScrape:
+    """Test in-process scraping records a pollable task"""
+
+    @staticmethod
+    def _api_video(video_id="dQw4w9WgXcQ", channel_id="UC_inline_channel"):
+        """YouTube API response for one video"""
+        from src.infrastructure.clients.youtube_api import VideoResponse
+
+        return VideoResponse(
+            id=video_id,
+            snippet={
+                "title": "Inline Video",
+                "description": "Scraped inline",
+                "publishedAt": "2024-01-01T00:00:00Z",
+                "channelId": channel_id,
+                "channelTitle": "Inline Channel",
+                "thumbnails": {"high": {"url": "https://i.ytimg.com/hq.jpg"}},
+                "tags": ["music", "video"],
+                "categoryId": "10",
+            },
+            statistics={"viewCount": 1000, "likeCount": 50, "commentCount": 5},
+            contentDetails={
+                "duration": "PT3M33S",
+                "definition": "hd",
+                "caption": "true",
+                "licensedContent": True,
+            },
+        )
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    @pytest.mark.asyncio
+    async def test_scrape_videos_inline_records_task(self, async_engine):
+        """Test inline scrape saves the videos and records the task"""
+        import importlib
+        from contextlib import asynccontextmanager
+
+        video_tasks = importlib.import_module("src.infrastructure.tasks.video_tasks")
+        task_repo_module = importlib.import_module(
+            "src.infrastructure.repositories.task_execution_repository"
+        )
+
+        client = Mock()
+        client.get_videos_batch.return_value = [self._api_video()]
+        session_factory = async_sessionmaker(
+            async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        @asynccontextmanager
+        async def engine_session():
+            async with session_factory() as session:
+                yield session
+                await session.commit()
+
+        with patch.object(
+            video_tasks, "create_task_record", AsyncMock()
+        ) as create_record, patch.object(
+            video_tasks.db_manager, "session", engine_session
+        ), patch.object(
+            task_repo_module, "TaskExecutionRepository", autospec=True
+        ) as task_repo_cls:
+            scraped = await video_tasks.scrape_videos_inline(
+                ["dQw4w9WgXcQ"], client, user_id="user-1"
+            )
+
+        task_id = scraped["task_id"]
+        assert task_id.startswith("inline-")
+        assert scraped["status"] == "success"
+        assert scraped["videos"] == [
+            {"video_id": "dQw4w9WgXcQ", "title": "Inline Video"}
+        ]
+        client.get_videos_batch.assert_called_once_with(["dQw4w9WgXcQ"])
+        assert create_record.await_args.kwargs["user_id"] == "user-1"
+        assert create_record.await_args.kwargs["task_id"] == task_id
+        task_repo = task_repo_cls.return_value
+        task_repo.mark_success.assert_awaited_once()
+        assert task_repo.mark_success.await_args.args[0] == task_id
+
+        async with session_factory() as session:
+            video = await session.get(Video, "dQw4w9WgXcQ")
+            channel = await session.get(Channel, "UC_inline_channel")
+
+        assert video.duration_seconds == 213
+        assert video.caption is True
+        assert video.tags == "music,video"
+        assert video.thumbnail_high == "https://i.ytimg.com/hq.jpg"
+        assert video.status == VideoStatus.COMPLETED
+        assert channel.name == "Inline Channel"
+
+    @pytest.mark.skipif(not CELERY_AVAILABLE, reason="Celery not installed")
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [ValueError("YouTube API quota exceeded"), TimeoutError("Rate limited")],
+    )
+    async def test_scrape_videos_inline_api_failure_records_nothing(self, error):
+        """Test any API failure is raised before a task is recorded"""
+        import importlib
+
+        video_tasks = importlib.import_module("src.infrastructure.tasks.video_tasks")
+
+        client = Mock()
+        client.get_videos_batch.side_effect = error
+
+        with patch.object(
+            video_tasks, "create_task_record", AsyncMock()
+        ) as create_record:
+            with pytest.raises(video_tasks.InlineScrapeUnavailable):
+                await video_tasks.scrape_videos_inline(["dQw4w9WgXcQ"], client)
+
+        create_record.assert_not_awaited()
+
+
 # ============================================================================
 # Run Tests
 # ============================================================================
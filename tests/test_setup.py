@@ -4,16 +4,11 @@ Tests configuration, cache, and database connectivity
 """
 
 import pytest
-import sys
 from pathlib import Path
 
-# ← ADD: Fix import path for tests
-ROOT_DIR = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT_DIR))
-
 import asyncio
 from sqlalchemy import text
-from src.app.config import get_config, validate_config, reset_config
+from src.app.config import get_config, validate_config, reset_config, reload_config
 from src.app.shared_cache import get_shared_cache, reset_cache
 from src.app.database import db_manager, init_db_async
 from src.infrastructure.database.connection import init_database_from_config
@@ -48,6 +43,22 @@ class TestConfiguration:
         assert "errors" in result
         assert "warnings" in result
 
+    def test_validation_recreates_removed_cache_root(self, tmp_path):
+        """Test validation stats the cache root even if this Config made it"""
+        import shutil
+        from src.app.config import Config, _run_validation
+
+        cache_root = tmp_path / "cache"
+        config = Config(config_path=str(tmp_path / "missing.yaml"))
+        config.__dict__["cache_root_path"] = cache_root
+        config._create_cache_directories()
+        shutil.rmtree(cache_root)
+
+        result = _run_validation(config)
+
+        assert f"Created cache root: {cache_root}" in result["warnings"]
+        assert cache_root.exists()
+
     def test_config_summary(self):
         """Test configuration summary generation"""
         config = get_config()
@@ -63,6 +74,105 @@ class TestConfiguration:
         for key, value in summary.items():
             print(f"  {key}: {value}")
 
+    def test_yaml_config_sidecar_cache(self, tmp_path):
+        """Test parsed YAML is cached to a JSON sidecar and refreshed on edit"""
+        import os
+        from src.app.config import Config
+
+        config_file = tmp_path / "app.yaml"
+        config_file.write_text("app:\n  name: first\n")
+
+        config = Config(config_path=str(config_file))
+        sidecar = tmp_path / "app.yaml.json"
+        assert config.yaml_config == {"app": {"name": "first"}}
+        assert sidecar.exists()
+
+        # Newer YAML invalidates the sidecar
+        config_file.write_text("app:\n  name: second\n")
+        stat = sidecar.stat()
+        os.utime(config_file, (stat.st_atime, stat.st_mtime + 1))
+
+        config = Config(config_path=str(config_file))
+        assert config.yaml_config["app"]["name"] == "second"
+
+    def test_config_get_dot_notation(self, tmp_path):
+        """Test dot-notation lookups, including repeated and missing keys"""
+        from src.app.config import Config
+
+        config_file = tmp_path / "app.yaml"
+        config_file.write_text("app:\n  name: demo\n  debug: null\n")
+        config = Config(config_path=str(config_file))
+
+        assert config.get("app.name") == "demo"
+        assert config.get("app.name") == "demo"
+        assert config.get("app.debug", "fallback") is None
+        assert config.get("app.missing", "fallback") == "fallback"
+        assert config.get("app.missing") is None
+
+    def test_config_sections_lazy(self, tmp_path):
+        """Test settings sections are only built when first accessed"""
+        from src.app.config import Config
+
+        config = Config(config_path=str(tmp_path / "missing.yaml"))
+        assert "scraping" not in vars(config)
+
+        assert config.scraping is config.scraping
+        assert "scraping" in vars(config)
+
+    def test_reload_reuses_env_settings(self):
+        """Test reload keeps env-backed sections unless asked to re-read"""
+        api = get_config().api
+
+        assert reload_config().api is api
+        assert reload_config(reload_env=True).api is not api
+
+    def test_soft_reset_keeps_config(self):
+        """Test a soft reset drops derived caches but keeps the instance"""
+        config = get_config()
+        config.get_summary()
+        validate_config()
+
+        reset_config(hard=False)
+
+        assert get_config() is config
+        assert "_summary_cache" not in vars(config)
+        assert config._validation_result is None
+
+    def test_setup_logging_replaces_queue_handler(self, tmp_path):
+        """Test re-running setup_logging keeps a single drained queue handler"""
+        import logging
+        import logging.handlers
+        from types import SimpleNamespace
+        from src.app.config import setup_logging, shutdown_logging
+
+        base = get_config()
+        config = SimpleNamespace(
+            logging=base.logging.model_copy(
+                update={"file_path": str(tmp_path / "app.log")}
+            ),
+            _ensure_dir=base._ensure_dir,
+        )
+        root_logger = logging.getLogger()
+        original_handlers = list(root_logger.handlers)
+
+        def queue_handlers():
+            return [
+                handler
+                for handler in root_logger.handlers
+                if isinstance(handler, logging.handlers.QueueHandler)
+            ]
+
+        try:
+            setup_logging(config)
+            setup_logging(config)
+            assert len(queue_handlers()) == 1
+
+            shutdown_logging()
+            assert queue_handlers() == []
+        finally:
+            shutdown_logging()
+            root_logger.handlers[:] = original_handlers
+
     def test_output_directories(self):
         """Test that output directories are created"""
         config = get_config()
@@ -76,6 +186,49 @@ class TestConfiguration:
         assert analysis_dir.exists()
         print(f"📁 Analysis output: {analysis_dir}")
 
+    def test_output_dir_created_once(self, monkeypatch):
+        """Test repeated output/cache dir lookups skip mkdir"""
+        config = get_config()
+        config.get_output_dir("repeat_check")
+        config.get_cache_dir("repeat_check")
+
+        calls = []
+        monkeypatch.setattr("os.makedirs", lambda *a, **k: calls.append(a))
+
+        assert config.get_output_dir("repeat_check").name == "repeat_check"
+        assert config.get_cache_dir("repeat_check").name == "repeat_check"
+        assert calls == []
+
+    def test_initialized_marker_not_trusted_for_dirs(self, tmp_path):
+        """Test dirs skipped via the .initialized marker are still created on use"""
+        from src.app.config import Config
+
+        cache_root = tmp_path / "cache"
+        cache_root.mkdir()
+        (cache_root / ".initialized").touch()
+
+        config = Config(config_path=str(tmp_path / "missing.yaml"))
+        config.__dict__["cache_root_path"] = cache_root
+        config._create_cache_directories()
+
+        assert cache_root / "temp" not in config._ensured_dirs
+        assert config._ensure_dir(cache_root / "temp").exists()
+
+    def test_skip_dir_creation(self, monkeypatch, tmp_path):
+        """Test CONFIG_SKIP_DIR_CREATION=1 skips the cache tree setup"""
+        from src.app.config import Config, _initialized_cache_roots
+
+        monkeypatch.setenv("CONFIG_SKIP_DIR_CREATION", "1")
+        config = Config(config_path=str(tmp_path / "missing.yaml"))
+        config.__dict__["cache_root_path"] = tmp_path / "cache"
+
+        config._create_cache_directories()
+
+        assert not (tmp_path / "cache").exists()
+        assert config._ensured_dirs == set()
+        assert tmp_path / "cache" not in _initialized_cache_roots
+        assert config._ensure_dir(tmp_path / "cache" / "temp").exists()
+
 
 class TestSharedCache:
     """Test shared cache system"""
@@ -87,6 +240,16 @@ class TestSharedCache:
         assert Path(cache.cache_root).exists()
         print(f"\n📦 Cache root: {cache.cache_root}")
 
+    def test_cache_singleton_concurrent(self):
+        """Test concurrent first calls build a single shared instance"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        reset_cache()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            caches = list(executor.map(lambda _: get_shared_cache(), range(8)))
+
+        assert all(cache is caches[0] for cache in caches)
+
     def test_cache_directories(self):
         """Test that cache directories are created"""
         cache = get_shared_cache()
@@ -106,6 +269,37 @@ class TestSharedCache:
 
         print(f"\n✅ All {len(required_dirs)} cache directories exist")
 
+    def test_cache_directories_lazy(self, tmp_path, monkeypatch):
+        """Test directories are created on first use, not at init"""
+        from src.app.shared_cache import SharedCache
+
+        # SharedCache exports CACHE_ROOT; restore it after the test
+        monkeypatch.delenv("CACHE_ROOT", raising=False)
+        cache = SharedCache(str(tmp_path / "lazy"))
+        assert not (tmp_path / "lazy" / "videos").exists()
+
+        assert cache.get_video_cache_path("vid").is_dir()
+        assert Path(cache.get_path("TEMP_DIR")).is_dir()
+        assert not (tmp_path / "lazy" / "embeddings").exists()
+
+    def test_cleanup_temp_files(self, tmp_path, monkeypatch):
+        """Test only stale temp files (including nested ones) are removed"""
+        import os
+        from src.app.shared_cache import SharedCache
+
+        monkeypatch.delenv("CACHE_ROOT", raising=False)
+        cache = SharedCache(str(tmp_path / "cleanup"))
+        downloads = Path(cache.get_path("TEMP_DOWNLOADS"))
+
+        stale = downloads / "old.part"
+        fresh = downloads / "new.part"
+        stale.write_text("x")
+        fresh.write_text("x")
+        os.utime(stale, (0, 0))
+
+        assert cache.cleanup_temp_files(older_than_hours=1) == 1
+        assert not stale.exists() and fresh.exists()
+
     def test_cache_summary(self):
         """Test cache summary generation"""
         cache = get_shared_cache()
@@ -119,6 +313,29 @@ class TestSharedCache:
         for key, value in summary.items():
             print(f"  {key}: {value}")
 
+    def test_cache_stats_cached(self):
+        """Test cache stats reuse the disk walk until invalidated"""
+        cache = get_shared_cache()
+
+        first = cache.get_cache_stats(force_refresh=True)
+        second = cache.get_cache_stats()
+        assert second["last_updated"] == first["last_updated"]
+
+        cache.invalidate_stats()
+        third = cache.get_cache_stats()
+        assert third["last_updated"] >= first["last_updated"]
+        assert "total_size_gb" in third
+
+    def test_gpu_info_probed_once(self, monkeypatch):
+        """Test GPU info is probed once and returned as a copy"""
+        cache = get_shared_cache()
+        first = cache.get_gpu_info()
+
+        monkeypatch.setattr(cache, "_probe_gpu", lambda: pytest.fail("re-probed"))
+        first["devices"].append("mutated")
+
+        assert cache.get_gpu_info()["devices"] != first["devices"]
+
     def test_memory_cache(self):
         """Test memory cache operations"""
         cache = get_shared_cache()
@@ -137,6 +354,33 @@ class TestSharedCache:
 
         print("\n✅ Memory cache operations work")
 
+    def test_memory_cache_lru_eviction(self, monkeypatch):
+        """Test memory cache evicts the least recently used item"""
+        cache = get_shared_cache()
+        cache.clear_memory_cache()
+        monkeypatch.setattr(cache, "_memory_max_items", 2)
+
+        cache.set_cache_item("a", 1)
+        cache.set_cache_item("b", 2)
+        cache.get_cache_item("a")
+        cache.set_cache_item("c", 3)
+
+        assert cache.get_cache_item("b") is None
+        assert cache.get_cache_item("a") == 1
+        assert cache.get_cache_item("c") == 3
+        cache.clear_memory_cache()
+
+    def test_memory_cache_expiry(self, monkeypatch):
+        """Test memory cache items expire after their TTL"""
+        from src.app import shared_cache
+
+        cache = get_shared_cache()
+        now = shared_cache.time.monotonic()
+        cache.set_cache_item("ttl_key", "value", ttl_seconds=5)
+
+        monkeypatch.setattr(shared_cache.time, "monotonic", lambda: now + 10)
+        assert cache.get_cache_item("ttl_key") is None
+
     def test_video_cache_path(self):
         """Test video-specific cache paths"""
         cache = get_shared_cache()
@@ -170,6 +414,23 @@ class TestSharedCache:
 
         print("\n✅ Registry operations work")
 
+    def test_registry_unchanged_save_skipped(self, tmp_path, monkeypatch):
+        """Test saving an identical registry does not rewrite the file"""
+        from src.app.shared_cache import SharedCache
+
+        monkeypatch.delenv("CACHE_ROOT", raising=False)
+        cache = SharedCache(str(tmp_path / "registry"))
+        registry_path = Path(cache.get_path("REGISTRY_FILE"))
+
+        cache.save_registry({"version": "1.0"})
+        registry_path.write_text("stale")  # would be overwritten by a write
+        cache.save_registry({"version": "1.0"})
+        assert registry_path.read_text() == "stale"
+
+        cache.save_registry({"version": "2.0"})
+        assert cache.load_registry()["version"] == "2.0"
+        assert not registry_path.with_suffix(".json.tmp").exists()
+
 
 class TestDatabase:
     """Test database connectivity"""
@@ -191,6 +452,34 @@ class TestDatabase:
         assert result
         print("\n✅ Database connection successful")
 
+    def test_database_ping(self):
+        """Test lightweight connection ping"""
+        if not db_manager.is_initialized:
+            init_database_from_config()
+
+        asyncio.run(db_manager.ping())
+
+    def test_warm_pool(self, tmp_path):
+        """Test pool warm-up opens up to pool_size connections"""
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+        from src.infrastructure.database.connection import DatabaseManager
+
+        async def _test():
+            # File SQLite defaults to NullPool; use a sized pool instead
+            manager = DatabaseManager()
+            manager._engine = create_async_engine(
+                f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}",
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=2,
+            )
+            try:
+                return await manager.warm_pool(5)
+            finally:
+                await manager.close()
+
+        assert asyncio.run(_test()) == 2
+
     def test_database_config(self):
         """Test database configuration"""
         config = get_config()
@@ -0,0 +1,51 @@
+# tests/unit/test_task_execution_repository.py
+"""
+Unit Tests for TaskExecutionRepository
+Tests query construction against a mocked session
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.elements import BindParameter
+
+from src.app.models.task_execution import TaskStatus
+from src.infrastructure.repositories.task_execution_repository import (
+    TaskExecutionRepository,
+)
+
+
+# ============================================================================
+# Pytest Configuration
+# ============================================================================
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+def _where_values(statement):
+    """Bound parameter values in a statement's WHERE clause"""
+    return [
+        element.value
+        for element in visitors.iterate(statement.whereclause)
+        if isinstance(element, BindParameter)
+    ]
+
+
+# ============================================================================
+# Failed Task Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_failed_tasks_since():
+    """Test an explicit since cutoff is used instead of the hours window"""
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    repo = TaskExecutionRepository(session)
+
+    since = datetime(2026, 1, 1)
+    await repo.get_failed_tasks(hours=1, since=since)
+
+    statement = session.execute.await_args.args[0]
+    assert _where_values(statement) == [TaskStatus.FAILED, since]
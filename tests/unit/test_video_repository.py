@@ -7,6 +7,8 @@ Tests all CRUD operations and query methods
 import pytest
 import pytest_asyncio
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -223,6 +225,103 @@ async def test_upsert_video(db_session, sample_channel):
     assert video2.scrape_count == 2
 
 
+@pytest.mark.asyncio
+async def test_bulk_upsert_mixed_new_and_existing(db_session, sample_videos):
+    """Test existing IDs are updated and new IDs inserted in one call"""
+    repo = VideoRepository(db_session)
+    channel_id = sample_videos[0].channel_id
+
+    created, updated = await repo.bulk_upsert_videos(
+        [
+            {"id": "video_0", "view_count": 99999},
+            {
+                "id": "bulk_new",
+                "channel_id": channel_id,
+                "title": "Bulk New",
+                "published_at": datetime.utcnow(),
+            },
+        ]
+    )
+
+    assert (created, updated) == (1, 1)
+    db_session.expire_all()
+    assert (await repo.get_by_id("video_0")).view_count == 99999
+    new_video = await repo.get_by_id("bulk_new")
+    assert new_video.title == "Bulk New"
+    assert new_video.scrape_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_repeated_ids(db_session, sample_channel):
+    """Test a repeated new ID is inserted once with the later data"""
+    repo = VideoRepository(db_session)
+
+    created, updated = await repo.bulk_upsert_videos(
+        [
+            {
+                "id": "bulk_dup",
+                "channel_id": sample_channel.id,
+                "title": "First",
+                "published_at": datetime.utcnow(),
+            },
+            {"id": "bulk_dup", "title": "Second", "view_count": 42},
+        ]
+    )
+
+    assert (created, updated) == (1, 1)
+    video = await repo.get_by_id("bulk_dup")
+    assert video.title == "Second"
+    assert video.view_count == 42
+    assert await repo.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_heterogeneous_keys(
+    async_engine, db_session, sample_channel
+):
+    """Test new rows with different key sets share one INSERT, with defaults"""
+    repo = VideoRepository(db_session)
+    inserts = []
+
+    def record_insert(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO videos"):
+            inserts.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record_insert)
+    created, updated = await repo.bulk_upsert_videos(
+        [
+            {
+                "id": "bulk_a",
+                "channel_id": sample_channel.id,
+                "title": "A",
+                "published_at": datetime.utcnow(),
+            },
+            {
+                "id": "bulk_b",
+                "channel_id": sample_channel.id,
+                "title": "B",
+                "published_at": datetime.utcnow(),
+                "view_count": 500,
+                "tags": "music,video",
+                "status": VideoStatus.COMPLETED,
+            },
+        ]
+    )
+
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record_insert)
+
+    assert (created, updated) == (2, 0)
+    assert len(inserts) == 1
+    video_a = await repo.get_by_id("bulk_a")
+    video_b = await repo.get_by_id("bulk_b")
+    assert video_a.view_count == 0
+    assert video_a.tags is None
+    assert video_a.status == VideoStatus.PENDING
+    assert video_b.view_count == 500
+    assert video_b.tags == "music,video"
+    assert video_b.status == VideoStatus.COMPLETED
+
+
 @pytest.mark.asyncio
 async def test_mark_status(db_session, sample_videos):
     """Test status management"""
@@ -328,6 +427,43 @@ async def test_delete_video(db_session, sample_videos):
     assert deleted is False
 
 
+# ============================================================================
+# Batch Loading Tests (mocked session, no mapper configuration needed)
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_list_with_relations_empty_ids():
+    """Test an empty ID list returns without querying"""
+    session = MagicMock()
+    session.execute = AsyncMock()
+    repo = VideoRepository(session)
+
+    assert await repo.list_with_relations([]) == []
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_list_with_relations_eager_options(monkeypatch):
+    """Test relationships are requested as selectin loads"""
+    from src.infrastructure.repositories import video_repository
+
+    statement = MagicMock()
+    monkeypatch.setattr(video_repository, "select", MagicMock(return_value=statement))
+    monkeypatch.setattr(video_repository, "selectinload", lambda attr: attr.key)
+
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    repo = VideoRepository(session)
+    options = statement.where.return_value.options
+
+    await repo.list_with_relations(["video_0", "video_1"])
+    assert set(options.call_args.args) == {"channel", "analytics", "comments"}
+
+    await repo.list_with_relations(["video_0"], include_comments=False)
+    assert set(options.call_args.args) == {"channel", "analytics"}
+
+
 # ============================================================================
 # Run Tests
 # ============================================================================
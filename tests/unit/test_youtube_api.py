@@ -9,12 +9,6 @@ import time
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 
-import sys
-from pathlib import Path
-
-ROOT_DIR = Path(__file__).resolve().parent.parent.parent
-sys.path.append(str(ROOT_DIR))
-
 from src.infrastructure.clients.youtube_api import (
     YouTubeAPIClient,
     QuotaTracker,
@@ -75,6 +69,24 @@ class TestQuotaTracker:
         tracker.consume_quota("search", count=2)
         assert tracker.used_quota == 205
 
+    def test_low_quota_warning_logged_once(self, caplog):
+        """Test low-quota warning fires once per day, not per call"""
+        tracker = QuotaTracker(daily_limit=1000)
+        tracker.used_quota = 100
+
+        with caplog.at_level("WARNING"):
+            for _ in range(5):
+                tracker.consume_quota("videos")
+
+        warnings = [r for r in caplog.records if "Low quota" in r.getMessage()]
+        assert len(warnings) == 1
+        assert tracker.low_quota_warned is True
+
+        # Daily reset re-arms the warning
+        tracker.reset_time = datetime.now() - timedelta(hours=1)
+        tracker._reset_if_needed()
+        assert tracker.low_quota_warned is False
+
     def test_quota_reset(self):
         """Test quota resets after 24 hours"""
         tracker = QuotaTracker(daily_limit=1000)
@@ -151,6 +163,23 @@ class TestTokenBucket:
         assert bucket.tokens >= 5.0
         assert bucket.tokens <= 10.0
 
+    def test_wait_for_tokens_fails_fast_on_short_timeout(self):
+        """Test waiting gives up immediately when refill can't beat timeout"""
+        bucket = TokenBucket(
+            capacity=1.0,
+            refill_rate=1.0,  # 1 token/second
+            tokens=0.0,
+            last_refill=time.time(),
+        )
+
+        start = time.time()
+        assert bucket.wait_for_tokens(1.0, timeout=0.1) is False
+        assert time.time() - start < 0.1
+
+        # Lock must not be held after giving up
+        assert bucket.lock.acquire(blocking=False)
+        bucket.lock.release()
+
 
 class TestRateLimiter:
     """Test rate limiter functionality"""
@@ -180,6 +209,20 @@ class TestRateLimiter:
         # With high refill rate (100/s), may acquire very quickly
         assert elapsed >= 0.001 or result is True  # Some wait or success
 
+    def test_simulate_burst_then_sustained(self):
+        """Test simulated admissions follow the token bucket invariants"""
+        limiter = RateLimiter(calls_per_second=5, burst_capacity=10)
+
+        # Burst: only capacity requests fit at the same instant
+        assert sum(limiter.simulate([0.0] * 15)) == 10
+
+        # Sustained: requests spaced at the refill rate are all admitted
+        spaced = [i / 5 for i in range(50)]
+        assert all(limiter.simulate(spaced))
+
+        # Simulation does not touch the live bucket
+        assert limiter.bucket.tokens == 10.0
+
     def test_rate_limit_decorator(self):
         """Test rate limit decorator"""
         call_times = []